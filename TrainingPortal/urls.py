@@ -22,6 +22,7 @@ from drf_yasg import openapi
 from rest_framework import permissions
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from myapp.redoc_urls import SCHEMA_CACHE_TIMEOUT
 
 schema_view = get_schema_view(
     openapi.Info(
@@ -39,8 +40,8 @@ urlpatterns = [
     path('myapp/',include('myapp.urls') ),
     path("accounts/", include("django.contrib.auth.urls")),
     path('api_async-auth/', include('rest_framework.urls')),
-    path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='swagger-ui'),
-    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='redoc-ui'),
+    path('swagger/', schema_view.with_ui('swagger', cache_timeout=SCHEMA_CACHE_TIMEOUT), name='swagger-ui'),
+    path('redoc/', schema_view.with_ui('redoc', cache_timeout=SCHEMA_CACHE_TIMEOUT), name='redoc-ui'),
     # JWT auth endpoints
     path('api_sync/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('api_sync/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
@@ -0,0 +1,19 @@
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import (
+    JWTAuthentication,
+    JWTStatelessUserAuthentication,
+)
+
+
+# Reads trust the signed token and skip the user query, so cached
+# list/retrieve hits stay query-free. Writes load the user row, so a
+# deactivated or deleted user can't change data with a token that is
+# still valid. Such a user can still read until the access token expires
+# (SIMPLE_JWT['ACCESS_TOKEN_LIFETIME']).
+class ReadStatelessJWTAuthentication(JWTAuthentication):
+    _stateless = JWTStatelessUserAuthentication()
+
+    def authenticate(self, request):
+        if request.method in SAFE_METHODS:
+            return self._stateless.authenticate(request)
+        return super().authenticate(request)
@@ -0,0 +1,87 @@
+import time
+from functools import wraps
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.cache import patch_cache_control
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_headers
+
+from .models import Members, Courses, Student, User
+
+# All API GET responses share one key prefix. Members are nested inside
+# courses and deletes cascade Members -> Courses -> Student, so a write
+# to any of these tables can change several endpoints; invalidating the
+# whole prefix keeps that simple.
+#
+# The default cache must be shared (REDIS_URL) when more than one worker
+# serves the API: LocMemCache is per process, so a write only
+# invalidates the worker that handled it.
+API_CACHE_PREFIX = 'api_sync'
+API_CACHE_TIMEOUT = 60 * 5
+API_CACHE_VERSION_KEY = f'{API_CACHE_PREFIX}.version'
+
+
+def _versioned_key_prefix():
+    # A timestamp never repeats, so an evicted version key can't bring
+    # back entries cached under an older one
+    version = cache.get_or_set(API_CACHE_VERSION_KEY, time.time_ns, timeout=None)
+    return f'{API_CACHE_PREFIX}.{version}'
+
+
+def _revalidate_on_client(response):
+    # cache_page sets max-age/Expires for the server-side copy; clients
+    # must not keep it, or they would serve stale data after the server
+    # invalidates, so they are told to revalidate (ETag / If-None-Match).
+    patch_cache_control(response, private=True, no_cache=True, max_age=0)
+    if response.has_header('Expires'):
+        del response['Expires']
+
+
+def _server_side_cache_page(view):
+    # cache_page with the current API cache version in its key prefix.
+    # DRF responses render late, so cache_page stores them from a
+    # post-render callback; the client headers are patched in a callback
+    # registered after it, or the stored copy would be marked private and
+    # UpdateCacheMiddleware would refuse to store it.
+    @wraps(view)
+    def wrapped(request, *args, **kwargs):
+        response = cache_page(API_CACHE_TIMEOUT, key_prefix=_versioned_key_prefix())(view)(
+            request, *args, **kwargs
+        )
+        if callable(getattr(response, 'render', None)) and not response.is_rendered:
+            response.add_post_render_callback(_revalidate_on_client)
+        else:
+            _revalidate_on_client(response)
+        return response
+    return wrapped
+
+
+# Use as @method_decorator(cached_read, name='list'). The key includes
+# the full URL (query params) and, through Vary, the Authorization header.
+cached_read = [
+    _server_side_cache_page,
+    vary_on_headers('Authorization'),
+]
+
+
+def invalidate_api_cache():
+    # A new version moves the API onto fresh keys and the old entries
+    # just expire; sessions and anything else in the default cache are
+    # left alone.
+    cache.set(API_CACHE_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+# Hooked on the models rather than the viewsets so writes made through
+# the UI views and the admin invalidate the API cache as well.
+@receiver(post_save, sender=Members)
+@receiver(post_save, sender=Courses)
+@receiver(post_save, sender=Student)
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=Members)
+@receiver(post_delete, sender=Courses)
+@receiver(post_delete, sender=Student)
+@receiver(post_delete, sender=User)
+def _invalidate_on_write(sender, **kwargs):
+    invalidate_api_cache()
@@ -0,0 +1,15 @@
+from rest_framework import routers
+from .api_views import (
+    MemberViewSet, CourseViewSet,
+    StudentViewSet, UserViewSet
+)
+
+# DefaultRouter keeps the API root view at api_sync/ that lists the
+# endpoints below
+router = routers.DefaultRouter()
+router.register(r'members', MemberViewSet)
+router.register(r'courses', CourseViewSet)
+router.register(r'students', StudentViewSet)
+router.register(r'users', UserViewSet)
+
+urlpatterns = router.urls
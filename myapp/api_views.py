@@ -1,28 +1,81 @@
-from rest_framework import viewsets
+from django.utils.decorators import method_decorator
+from rest_framework import serializers, viewsets
+from rest_framework.response import Response
 from .models import Members, Courses, Student, User
 from .serializers import (
     MemberSerializer, CourseSerializer,
     StudentSerializer, UserSerializer
 )
 from rest_framework.permissions import IsAuthenticated
+from .api_cache import cached_read
 
-class MemberViewSet(viewsets.ModelViewSet):
-    queryset = Members.objects.all()
+
+class ValuesListMixin:
+    """Serve list() straight from queryset.values().
+
+    Skips building a model instance and running the serializer for every
+    row. The columns are the serializer's readable fields, and values are
+    converted where the raw column differs from what the serializer would
+    send (datetimes, file URLs), so list rows match retrieve().
+    Create/update/retrieve still go through the serializer.
+    """
+
+    def list(self, request, *args, **kwargs):
+        fields = self.get_serializer()._readable_fields
+        names = [field.field_name for field in fields]
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            *[field.source for field in fields])
+        converters = [self._value_converter(field, request) for field in fields]
+
+        page = self.paginate_queryset(queryset)
+        rows = [
+            {name: value if value is None or convert is None else convert(value)
+             for name, convert, value in zip(names, converters, row.values())}
+            for row in (queryset if page is None else page)
+        ]
+        if page is not None:
+            return self.get_paginated_response(rows)
+        return Response(rows)
+
+    @staticmethod
+    def _value_converter(field, request):
+        if isinstance(field, serializers.FileField):
+            storage = field.parent.Meta.model._meta.get_field(field.source).storage
+            return lambda name: request.build_absolute_uri(storage.url(name)) if name else None
+        if isinstance(field, serializers.DateTimeField):
+            return field.to_representation
+        return None
+
+@method_decorator(cached_read, name='list')
+@method_decorator(cached_read, name='retrieve')
+class MemberViewSet(ValuesListMixin, viewsets.ModelViewSet):
+    queryset = Members.objects.order_by('-id')
     serializer_class = MemberSerializer
     permission_classes = [IsAuthenticated]
 
+@method_decorator(cached_read, name='list')
+@method_decorator(cached_read, name='retrieve')
 class CourseViewSet(viewsets.ModelViewSet):
-    queryset = Courses.objects.all()
+    # JOIN the faculty row up front so the nested MemberSerializer
+    # doesn't issue one extra query per course; the nested faculty
+    # representation has no image, so leave that column out of the JOIN
+    queryset = (Courses.objects.select_related('facultyname')
+                .defer('facultyname__image')
+                .order_by('-startdate', '-id'))
     serializer_class = CourseSerializer
     permission_classes = [IsAuthenticated]
 
-class StudentViewSet(viewsets.ModelViewSet):
-    queryset = Student.objects.all()
+@method_decorator(cached_read, name='list')
+@method_decorator(cached_read, name='retrieve')
+class StudentViewSet(ValuesListMixin, viewsets.ModelViewSet):
+    queryset = Student.objects.order_by('-id')
     serializer_class = StudentSerializer
     permission_classes = [IsAuthenticated]
 
-class UserViewSet(viewsets.ModelViewSet):
-    queryset = User.objects.all()
+@method_decorator(cached_read, name='list')
+@method_decorator(cached_read, name='retrieve')
+class UserViewSet(ValuesListMixin, viewsets.ModelViewSet):
+    queryset = User.objects.order_by('-id')
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]
 
@@ -5,4 +5,8 @@ class MyappConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'myapp'
 
+    def ready(self):
+        # Registers the signal handlers that invalidate the API cache
+        from . import api_cache  # noqa: F401
+
 
@@ -0,0 +1,13 @@
+from rest_framework.metadata import SimpleMetadata
+
+
+class LightMetadata(SimpleMetadata):
+    """SimpleMetadata without the per-field "actions" description.
+
+    Building "actions" instantiates the serializer and walks every field
+    on each OPTIONS request; the schema endpoints already document that.
+    """
+
+    def determine_actions(self, request, view):
+        return {}
+
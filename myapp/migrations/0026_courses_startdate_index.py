@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-15 22:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0025_alter_student_email_alter_student_resume_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='courses',
+            index=models.Index(fields=['startdate'], name='myapp_cours_startda_3673e8_idx'),
+        ),
+    ]
@@ -33,6 +33,10 @@ class Courses(models.Model):
     category=models.CharField(max_length=255, choices=CATEGORY)
 #    # teachers = models.ManyToManyField(Members)
 
+    class Meta:
+        # The courses API lists newest start date first
+        indexes = [models.Index(fields=['startdate'])]
+
     # Upon creating this object return to list view for this object
     #This method can also be part of ,<object>CreateView
     def get_absolute_url(self):
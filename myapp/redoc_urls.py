@@ -2,6 +2,9 @@ from django.urls import path
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 
+# The schema only changes on deploy; cache the generated document
+SCHEMA_CACHE_TIMEOUT = 60 * 60
+
 schema_view = get_schema_view(
     openapi.Info(
         title="TrainingPortal API",
@@ -11,5 +14,5 @@ schema_view = get_schema_view(
 )
 
 urlpatterns = [
-    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='redoc-ui'),
+    path('redoc/', schema_view.with_ui('redoc', cache_timeout=SCHEMA_CACHE_TIMEOUT), name='redoc-ui'),
 ]
\ No newline at end of file
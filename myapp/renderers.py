@@ -0,0 +1,28 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class OrjsonRenderer(JSONRenderer):
+    """JSONRenderer that encodes with orjson instead of the stdlib json module.
+
+    Types orjson doesn't know (Decimal, lazy translation strings, ...)
+    go through DRF's own JSONEncoder, so the output matches JSONRenderer.
+    """
+    _encoder = JSONRenderer.encoder_class()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        option = orjson.OPT_NON_STR_KEYS
+        # orjson only pretty prints with a 2-space indent
+        if self.get_indent(accepted_media_type, renderer_context):
+            option |= orjson.OPT_INDENT_2
+
+        ret = orjson.dumps(data, default=self._encoder.default, option=option)
+
+        # Same \u2028 / \u2029 escaping as JSONRenderer
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
@@ -1,16 +1,53 @@
+from copy import copy
+
+from django.utils.functional import cached_property
+
 from rest_framework import serializers
 from .models import Members, Courses, Student, User
 
-class MemberSerializer(serializers.ModelSerializer):
+
+class CachedFieldsMixin:
+    """Build the serializer's fields once per class instead of per instance.
+
+    ModelSerializer.get_fields() deep-copies the declared fields and
+    introspects the model every time a serializer is created. The result
+    only depends on the class, so keep it as a template and hand out
+    shallow copies; each copy is bound to its new parent by `fields`.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = self.__class__
+        if cls not in cls._fields_cache:
+            cls._fields_cache[cls] = super().get_fields()
+        return {name: copy(field) for name, field in cls._fields_cache[cls].items()}
+
+    @cached_property
+    def _readable_fields(self):
+        # DRF rebuilds this generator for every object it serializes; with
+        # many=True the same child instance serializes every row, so
+        # filter out the write-only fields once.
+        return [field for field in self.fields.values() if not field.write_only]
+
+
+class MemberSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Members
-        fields = '__all__'
+        fields = ['id', 'firstname', 'lastname', 'designation', 'image']
+
+class NestedMemberSerializer(MemberSerializer):
+    # Trimmed faculty representation embedded in every course row
+    class Meta(MemberSerializer.Meta):
+        fields = ['id', 'firstname', 'lastname', 'designation']
 
-class CourseSerializer(serializers.ModelSerializer):
+class CourseSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     # Show faculty details inside course API
-    facultyname = MemberSerializer(read_only=True)
+    facultyname = NestedMemberSerializer(read_only=True)
+    # The validated member is echoed back through NestedMemberSerializer,
+    # so load just the columns it renders
     facultyname_id = serializers.PrimaryKeyRelatedField(
-        queryset=Members.objects.all(), source='facultyname', write_only=True
+        queryset=Members.objects.only('id', 'firstname', 'lastname', 'designation'),
+        source='facultyname', write_only=True
     )
 
     class Meta:
@@ -18,12 +55,15 @@ class CourseSerializer(serializers.ModelSerializer):
         fields = ['id', 'coursename', 'facultyname', 'facultyname_id',
                   'startdate', 'enddate', 'category']
 
-class StudentSerializer(serializers.ModelSerializer):
+class StudentSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Student
-        fields = '__all__'
+        fields = ['id', 'firstname', 'lastname', 'doj', 'resume',
+                  'skills', 'email', 'course']
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
-        fields = '__all__'
+        fields = ['id', 'username', 'password', 'email', 'image']
+        # Accept the password on writes but never send it back
+        extra_kwargs = {'password': {'write_only': True}}
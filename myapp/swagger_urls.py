@@ -1,6 +1,7 @@
 from django.urls import path
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
+from .redoc_urls import SCHEMA_CACHE_TIMEOUT
 
 schema_view = get_schema_view(
     openapi.Info(
@@ -11,5 +12,5 @@ schema_view = get_schema_view(
 )
 
 urlpatterns = [
-    path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='swagger-ui'),
+    path('swagger/', schema_view.with_ui('swagger', cache_timeout=SCHEMA_CACHE_TIMEOUT), name='swagger-ui'),
 ]
\ No newline at end of file
@@ -1,16 +1,5 @@
 from django.urls import path, include
 from . import views
-from rest_framework import routers
-from .api_views import (
-    MemberViewSet, CourseViewSet,
-    StudentViewSet, UserViewSet
-)
-
-router = routers.DefaultRouter()
-router.register(r'members', MemberViewSet)
-router.register(r'courses', CourseViewSet)
-router.register(r'students', StudentViewSet)
-router.register(r'users', UserViewSet)
 
 urlpatterns = [
     path('', views.index, name='index'),
@@ -28,5 +17,5 @@ urlpatterns = [
     path('courses/update/<pk>', views.CourseUpdateView.as_view(), name='updatecourse'),
 
     # API routes
-    path('api_sync/', include(router.urls)),
+    path('api_sync/', include('myapp.api_urls')),
 ]
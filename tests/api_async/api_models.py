@@ -2,137 +2,161 @@
 
 Defines data classes for API request/response payloads and entity-specific
 validators. Demonstrates encapsulation and composition patterns.
+Field names follow the serializers in myapp/serializers.py.
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import Optional, Dict, Any, List
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 from enum import Enum
 
 
 class CourseCategory(Enum):
-    """Course category enum (matches Django choices)."""
-    PROGRAMMING = "Programming"
-    WEB_DEV = "Web Dev"
-    DATA_ANALYSIS = "Data Analysis"
-    DEVOPS = "DevOps"
-    TESTING = "Testing"
-    OTHERS = "Others"
+    """Course category enum (the stored codes of Courses.CATEGORY)."""
+    PROGRAMMING = "P"
+    WEB_DEV = "W"
+    DATA_ANALYSIS = "D"
+    DEVOPS = "O"
+    TESTING = "T"
+    OTHERS = "X"
+
+
+# Plain-string view of the categories, for membership checks
+VALID_CATEGORIES = frozenset(c.value for c in CourseCategory)
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls) -> Tuple[str, ...]:
+    """Field names of a dataclass, computed once per class."""
+    return tuple(f.name for f in fields(cls))
+
+
+def _from_dict(cls, data: Dict[str, Any]):
+    """Build a response model from an API dict; absent keys become None."""
+    return cls(**{name: data.get(name) for name in _field_names(cls)})
 
 
 @dataclass
 class MemberRequest:
     """Request payload for creating/updating a member."""
-    first_name: str
-    last_name: str
+    firstname: str
+    lastname: str
     designation: str
-    email: Optional[str] = None
-    phone: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to API request dict."""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        return {k: v for k, v in vars(self).items() if v is not None}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MemberResponse:
     """Response payload from member API."""
     id: int
-    first_name: str
-    last_name: str
+    firstname: str
+    lastname: str
     designation: str
-    email: Optional[str] = None
-    phone: Optional[str] = None
+    image: Optional[str] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MemberResponse":
         """Create from API response dict."""
-        return cls(
-            id=data.get("id"),
-            first_name=data.get("first_name"),
-            last_name=data.get("last_name"),
-            designation=data.get("designation"),
-            email=data.get("email"),
-            phone=data.get("phone")
-        )
+        return _from_dict(cls, data)
+
+    def validate_required(self) -> None:
+        """Assert the name fields are non-blank."""
+        assert self.firstname and not self.firstname.isspace(), \
+            f"Expected firstname to be non-empty, got: {self.firstname!r}"
+        assert self.lastname and not self.lastname.isspace(), \
+            f"Expected lastname to be non-empty, got: {self.lastname!r}"
 
 
 @dataclass
 class CourseRequest:
-    """Request payload for creating/updating a course."""
-    course_name: str
+    """Request payload for creating/updating a course.
+
+    startdate/enddate are ISO 8601 datetimes; the columns are NOT NULL, so
+    a create without them fails.
+    """
+    coursename: str
     facultyname_id: int
-    category: str  # Use CourseCategory value
-    start_date: Optional[str] = None
-    end_date: Optional[str] = None
-    description: Optional[str] = None
+    category: str  # a CourseCategory value
+    startdate: str
+    enddate: str
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to API request dict."""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        return {k: v for k, v in vars(self).items() if v is not None}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CourseResponse:
     """Response payload from course API."""
     id: int
-    course_name: str
-    facultyname_id: int
-    facultyname: Optional[Dict[str, Any]] = None
+    coursename: str
+    facultyname: Dict[str, Any]  # nested member; facultyname_id is write-only
     category: Optional[str] = None
-    start_date: Optional[str] = None
-    end_date: Optional[str] = None
-    description: Optional[str] = None
+    startdate: Optional[str] = None
+    enddate: Optional[str] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CourseResponse":
         """Create from API response dict."""
-        return cls(
-            id=data.get("id"),
-            course_name=data.get("course_name"),
-            facultyname_id=data.get("facultyname_id"),
-            facultyname=data.get("facultyname"),
-            category=data.get("category"),
-            start_date=data.get("start_date"),
-            end_date=data.get("end_date"),
-            description=data.get("description")
-        )
+        return _from_dict(cls, data)
+
+    def validate_required(self) -> None:
+        """Assert the course name is non-blank and the category is a known code."""
+        assert self.coursename and not self.coursename.isspace(), \
+            f"Expected coursename to be non-empty, got: {self.coursename!r}"
+        assert self.category in VALID_CATEGORIES, \
+            f"Expected category in {sorted(VALID_CATEGORIES)}, got: {self.category!r}"
 
 
 @dataclass
 class StudentRequest:
-    """Request payload for creating/updating a student."""
-    name: str
-    course_id: int
+    """Request payload for creating/updating a student (doj: ISO 8601 datetime)."""
+    firstname: str
+    lastname: str
+    doj: str
+    course: int
     email: Optional[str] = None
-    resume_url: Optional[str] = None
+    resume: Optional[str] = None
     skills: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to API request dict."""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        return {k: v for k, v in vars(self).items() if v is not None}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StudentResponse:
     """Response payload from student API."""
     id: int
-    name: str
-    course_id: int
+    firstname: str
+    lastname: str
+    course: int
+    doj: Optional[str] = None
     email: Optional[str] = None
-    resume_url: Optional[str] = None
+    resume: Optional[str] = None
     skills: Optional[str] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "StudentResponse":
         """Create from API response dict."""
-        return cls(
-            id=data.get("id"),
-            name=data.get("name"),
-            course_id=data.get("course_id"),
-            email=data.get("email"),
-            resume_url=data.get("resume_url"),
-            skills=data.get("skills")
-        )
+        return _from_dict(cls, data)
+
+    def validate_required(self) -> None:
+        """Assert the name fields are non-blank."""
+        assert self.firstname and not self.firstname.isspace(), \
+            f"Expected firstname to be non-empty, got: {self.firstname!r}"
+        assert self.lastname and not self.lastname.isspace(), \
+            f"Expected lastname to be non-empty, got: {self.lastname!r}"
+
+
+# Fields each response must carry
+_MEMBER_REQUIRED = frozenset(("id", "firstname", "lastname", "designation"))
+_COURSE_REQUIRED = frozenset(("id", "coursename", "facultyname"))
+_STUDENT_REQUIRED = frozenset(("id", "firstname", "lastname", "course"))
+_PAGINATION_REQUIRED = frozenset(("count", "results"))
 
 
 class ApiValidator:
@@ -141,33 +165,29 @@ class ApiValidator:
     @staticmethod
     def validate_member_response(data: Dict[str, Any]) -> MemberResponse:
         """Validate and parse member response."""
-        required_fields = ["id", "first_name", "last_name", "designation"]
-        for field in required_fields:
-            assert field in data, f"Missing required field: {field}"
+        missing = _MEMBER_REQUIRED - data.keys()
+        assert not missing, f"Missing required fields: {sorted(missing)}"
         return MemberResponse.from_dict(data)
 
     @staticmethod
     def validate_course_response(data: Dict[str, Any]) -> CourseResponse:
         """Validate and parse course response."""
-        required_fields = ["id", "course_name", "facultyname_id"]
-        for field in required_fields:
-            assert field in data, f"Missing required field: {field}"
+        missing = _COURSE_REQUIRED - data.keys()
+        assert not missing, f"Missing required fields: {sorted(missing)}"
         return CourseResponse.from_dict(data)
 
     @staticmethod
     def validate_student_response(data: Dict[str, Any]) -> StudentResponse:
         """Validate and parse student response."""
-        required_fields = ["id", "name", "course_id"]
-        for field in required_fields:
-            assert field in data, f"Missing required field: {field}"
+        missing = _STUDENT_REQUIRED - data.keys()
+        assert not missing, f"Missing required fields: {sorted(missing)}"
         return StudentResponse.from_dict(data)
 
     @staticmethod
     def validate_pagination_response(data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate paginated list response (DRF format)."""
-        required_fields = ["count", "results"]
-        for field in required_fields:
-            assert field in data, f"Missing required field: {field}"
+        missing = _PAGINATION_REQUIRED - data.keys()
+        assert not missing, f"Missing required fields: {sorted(missing)}"
         return data
 
     @staticmethod
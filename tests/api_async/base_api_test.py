@@ -1,7 +1,7 @@
 """Base API Test Class using Playwright - API validations through browser automation
 
 Provides:
-- Playwright-based HTTP client using page.fetch()
+- Playwright-based HTTP client on a shared APIRequestContext
 - Response validation framework with fluent chaining
 - Comprehensive 429 (Too Many Requests) rate limit handling
 - Exponential backoff and retry strategies
@@ -15,21 +15,31 @@ Advantages of Playwright approach:
 - Better integration testing (full request/response cycle)
 
 Usage:
-    async def test_example(page):
-        client = PlaywrightApiClient(page)
-        resp = await client.get("members")
+    async def test_example(playwright_client):
+        resp = await playwright_client.get("members")
         assert resp.is_success()
 """
 
+import asyncio
+import inspect
 import pytest
+import pytest_asyncio
 import time
 import random
-import json
 import re
-from typing import Dict, Any, List, Optional
+import orjson
+from collections import defaultdict, deque
+from typing import Any, Awaitable, Deque, Dict, Iterable, List, Optional, Tuple, Union
 from enum import Enum
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, partialmethod
+from urllib.parse import urlparse
+
+from tests.api_async.api_models import (
+    MemberRequest, CourseRequest, StudentRequest, CourseCategory
+)
 
 
 class HttpMethod(Enum):
@@ -41,9 +51,12 @@ class HttpMethod(Enum):
     DELETE = "DELETE"
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiResponse:
-    """Encapsulates API response data from Playwright fetch."""
+    """Encapsulates API response data from a Playwright request.
+
+    Header names are lowercased on construction; look them up in lowercase.
+    """
     status_code: int
     body: Dict[str, Any]
     headers: Dict[str, str]
@@ -51,6 +64,9 @@ class ApiResponse:
     retry_count: int = 0
     was_rate_limited: bool = False
 
+    def __post_init__(self):
+        self.headers = {name.lower(): value for name, value in self.headers.items()}
+
     def is_success(self) -> bool:
         """Check if response is 2xx."""
         return 200 <= self.status_code < 300
@@ -78,7 +94,7 @@ class ApiResponse:
         - Retry-After: 120 (delta-seconds)
         - Retry-After: Wed, 21 Oct 2025 07:28:00 GMT (HTTP-date)
         """
-        retry_after = self.headers.get("Retry-After", self.headers.get("retry-after"))
+        retry_after = self.headers.get("retry-after")
         if not retry_after:
             return None
         
@@ -86,18 +102,22 @@ class ApiResponse:
             # Try parsing as integer (delta-seconds)
             return float(retry_after)
         except ValueError:
-            # Try parsing as HTTP-date
+            # Try parsing as HTTP-date (RFC 5322 format, as used by email)
             try:
-                retry_date = datetime.strptime(retry_after, "%a, %d %b %Y %H:%M:%S %Z")
-                delta = (retry_date - datetime.utcnow()).total_seconds()
-                return max(0, delta)
-            except ValueError:
+                retry_date = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
                 return None
+            if retry_date.tzinfo is None:
+                retry_date = retry_date.replace(tzinfo=timezone.utc)
+            delta = (retry_date - datetime.now(timezone.utc)).total_seconds()
+            return max(0.0, delta)
 
 
 class ResponseValidator:
     """Validates API responses against expected conditions using fluent chaining."""
 
+    __slots__ = ("response",)
+
     def __init__(self, response: ApiResponse):
         self.response = response
 
@@ -143,10 +163,11 @@ class ResponseValidator:
             f"Expected key '{key}' in response. Available: {self.response.body.keys()}"
         return self
 
-    def assert_has_keys(self, keys: List[str]) -> "ResponseValidator":
-        """Assert response body has multiple keys."""
-        for key in keys:
-            self.assert_has_key(key)
+    def assert_has_keys(self, keys: Iterable[str]) -> "ResponseValidator":
+        """Assert response body has multiple keys (a frozenset is used as-is)."""
+        missing = frozenset(keys) - self.response.body.keys()
+        assert not missing, \
+            f"Expected keys {sorted(missing)} in response. Available: {self.response.body.keys()}"
         return self
 
     def assert_key_equals(self, key: str, value: Any) -> "ResponseValidator":
@@ -189,8 +210,8 @@ class ResponseValidator:
         return self
 
     def assert_header_present(self, header_name: str) -> "ResponseValidator":
-        """Assert response header is present."""
-        assert header_name in self.response.headers, \
+        """Assert response header is present (case-insensitive)."""
+        assert header_name.lower() in self.response.headers, \
             f"Expected header '{header_name}'. Available: {self.response.headers.keys()}"
         return self
 
@@ -201,26 +222,35 @@ class ResponseValidator:
         return self
 
 
-@dataclass
+@dataclass(slots=True)
 class RateLimitMetrics:
     """Metrics for rate limit handling and retry behavior."""
     total_rate_limited: int = 0
     total_retries: int = 0
     total_backoff_seconds: float = 0.0
     max_backoff_seconds: float = 0.0
-    rate_limit_timestamps: List[datetime] = field(default_factory=list)
+    # time.monotonic() of the most recent rate limit events only
+    rate_limit_timestamps: Deque[float] = field(default_factory=lambda: deque(maxlen=1024))
 
     def record_rate_limit(self, backoff_seconds: float):
         """Record a rate limit event."""
         self.total_rate_limited += 1
         self.total_backoff_seconds += backoff_seconds
         self.max_backoff_seconds = max(self.max_backoff_seconds, backoff_seconds)
-        self.rate_limit_timestamps.append(datetime.now())
+        self.rate_limit_timestamps.append(time.monotonic())
 
     def record_retry(self):
         """Record a retry attempt."""
         self.total_retries += 1
 
+    def reset(self):
+        """Zero all counters in place."""
+        self.total_rate_limited = 0
+        self.total_retries = 0
+        self.total_backoff_seconds = 0.0
+        self.max_backoff_seconds = 0.0
+        self.rate_limit_timestamps.clear()
+
     def __str__(self) -> str:
         """Summary of rate limit metrics."""
         return (
@@ -232,24 +262,130 @@ class RateLimitMetrics:
         )
 
 
+class AimdLimiter:
+    """Additive-increase/multiplicative-decrease cap on in-flight requests.
+
+    The limit grows by one after every INCREASE_EVERY successes that came
+    back under TARGET_LATENCY_MS (if set), and halves on a 429 or 5xx, so
+    concurrent callers settle near what the server can take instead of
+    all hitting 429 and backing off together.
+    """
+
+    INITIAL_LIMIT = 4
+    MIN_LIMIT = 1
+    MAX_LIMIT = 32
+    INCREASE_EVERY = 20
+    TARGET_LATENCY_MS: Optional[float] = None
+
+    def __init__(self):
+        self.limit = self.INITIAL_LIMIT
+        self.in_flight = 0
+        self._successes = 0
+        self._waiters: List[asyncio.Future] = []
+
+    async def acquire(self):
+        """Wait until fewer than `limit` requests are in flight."""
+        while self.in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+
+    def release(self, status_code: Optional[int] = None, elapsed_ms: Optional[float] = None):
+        """Free a slot and adjust the limit from the response, if any."""
+        self.in_flight -= 1
+        if status_code is not None:
+            if status_code == 429 or status_code >= 500:
+                self.limit = max(self.MIN_LIMIT, self.limit // 2)
+                self._successes = 0
+            elif 200 <= status_code < 300 and (
+                    self.TARGET_LATENCY_MS is None or elapsed_ms <= self.TARGET_LATENCY_MS):
+                self._successes += 1
+                if self._successes >= self.INCREASE_EVERY:
+                    self.limit = min(self.MAX_LIMIT, self.limit + 1)
+                    self._successes = 0
+        # Waiters re-check the limit themselves
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._waiters.clear()
+
+
+class JwtTokens:
+    """Access/refresh token pair for the test user.
+
+    The client sends the access token on every request. Access tokens are
+    short-lived (SIMPLE_JWT ACCESS_TOKEN_LIFETIME), so when the server
+    answers 401 the client calls renew() and resends once.
+    """
+
+    def __init__(self, request_context, username: str, password: str):
+        self.request = request_context
+        self._credentials = {"username": username, "password": password}
+        self.access: Optional[str] = None
+        self._refresh: Optional[str] = None
+        # Concurrent 401s renew once; the rest reuse the new token
+        self._lock = asyncio.Lock()
+
+    @property
+    def header(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.access}"}
+
+    async def login(self):
+        """Obtain a fresh token pair with the username and password."""
+        resp = await self.request.post(PlaywrightApiClient.TOKEN_URL, data=self._credentials)
+        assert resp.ok, f"Login failed: {await resp.text()}"
+        data = await resp.json()
+        self.access, self._refresh = data["access"], data["refresh"]
+
+    async def renew(self, rejected: str):
+        """Replace the access token behind the rejected Authorization header,
+        unless another request already has.
+
+        Falls back to logging in again once the refresh token has expired too.
+        """
+        async with self._lock:
+            if rejected != self.header["Authorization"]:
+                return
+            resp = await self.request.post(PlaywrightApiClient.TOKEN_REFRESH_URL,
+                                           data={"refresh": self._refresh})
+            if resp.ok:
+                self.access = (await resp.json())["access"]
+            else:
+                await self.login()
+
+
 class PlaywrightApiClient:
     """Playwright-based HTTP client for API testing with rate limit handling.
 
-    Uses page.fetch() for true browser-based HTTP requests with:
+    Sends requests through one Playwright APIRequestContext, reused for
+    every call so connections stay alive, with:
     - Rate limiting (429) automatic retry
     - Exponential backoff with jitter
     - Circuit breaker pattern
     - RFC 7231 Retry-After header support
     
     Example:
-        async def test_api(page):
-            client = PlaywrightApiClient(page)
+        async def test_api(api_request_context, api_tokens):
+            client = PlaywrightApiClient(api_request_context, tokens=api_tokens)
             resp = await client.get("members")
             assert resp.is_success()
     """
 
     BASE_URL = "http://127.0.0.1:8000"
-    API_PREFIX = "/api_async"
+    # The DRF router is mounted under myapp/ (see myapp/urls.py)
+    API_PREFIX = "/myapp/api_sync"
+    # base_url for the request context; endpoints are sent relative to it
+    API_URL = f"{BASE_URL}{API_PREFIX}/"
+    # simplejwt token pair view; the API requires a Bearer access token
+    TOKEN_URL = f"{BASE_URL}/api_sync/token/"
+    TOKEN_REFRESH_URL = f"{BASE_URL}/api_sync/token/refresh/"
+    # Sent on every request as the context's extra_http_headers
+    DEFAULT_HEADERS = {"Content-Type": "application/json"}
     
     # Rate limiting configuration
     MAX_RETRIES = 3
@@ -258,144 +394,264 @@ class PlaywrightApiClient:
     BACKOFF_MULTIPLIER = 2.0
     ENABLE_JITTER = True
     CIRCUIT_BREAKER_THRESHOLD = 5
-
-    def __init__(self, page):
-        """Initialize with Playwright page object.
+    # Once tripped, requests skip the network for 2**trips seconds, capped
+    CIRCUIT_OPEN_MAX_SECONDS = 60.0
+
+    # Proactive limiting: block before sending instead of waiting for a 429.
+    # RPM_LIMIT=None disables the window (the dev server doesn't throttle).
+    RPM_LIMIT: Optional[int] = None
+    RATE_WINDOW_SECONDS = 60.0
+    # Pause when X-RateLimit-Remaining drops below this share of the limit
+    RATE_LIMIT_LOW_WATERMARK = 0.1
+
+    # Limits are tracked per bucket (the endpoint's first path segment,
+    # e.g. "members"), so a throttled endpoint doesn't slow the others.
+    # Send times and pause deadlines are shared by every client in the process
+    _send_times: Dict[str, Deque[float]] = defaultdict(deque)
+    _paused_until: Dict[str, float] = defaultdict(float)
+    # Rate limit metrics for the whole session (per xdist worker)
+    metrics = RateLimitMetrics()
+    # Backoff and budget waits sleep through this, so tests can swap in
+    # virtual time without patching asyncio for the whole event loop
+    _sleep = staticmethod(asyncio.sleep)
+
+    def __init__(self, request_context, tokens: Optional[JwtTokens] = None,
+                 etag_cache: Optional[Dict[str, ApiResponse]] = None,
+                 limiters: Optional[Dict[str, AimdLimiter]] = None):
+        """Initialize with a Playwright APIRequestContext.
         
         Args:
-            page: Playwright Page object for making fetch requests
+            request_context: APIRequestContext created with
+                base_url=PlaywrightApiClient.API_URL and
+                extra_http_headers=PlaywrightApiClient.DEFAULT_HEADERS
+            tokens: JWT pair sent as the Bearer token and renewed on a 401
+                (no Authorization header is added if omitted)
+            etag_cache: endpoint -> last ETagged GET, shared between clients
+                so a later test revalidates instead of re-fetching (a fresh
+                dict if omitted)
+            limiters: bucket -> AimdLimiter, shared between clients so the
+                limit adapts to all concurrent tests' traffic (fresh ones if
+                omitted)
         """
-        self.page = page
-        self.metrics = RateLimitMetrics()
-        self.consecutive_rate_limits = 0
+        self.request = request_context
+        self.tokens = tokens
+        self.limiters: Dict[str, AimdLimiter] = \
+            defaultdict(AimdLimiter) if limiters is None else limiters
+        self.consecutive_rate_limits: Dict[str, int] = defaultdict(int)
+        # Circuit breaker: open-until deadline and trips since last success
+        self._circuit_open_until: Dict[str, float] = defaultdict(float)
+        self._circuit_trips: Dict[str, int] = defaultdict(int)
+        # Last ETagged 2xx GET per endpoint, revalidated with If-None-Match
+        self._etag_cache: Dict[str, ApiResponse] = {} if etag_cache is None else etag_cache
 
     async def _make_request(
         self,
         method: str,
         endpoint: str,
-        data: Optional[Dict[str, Any]] = None,
-        headers: Optional[Dict[str, str]] = None,
-        attempt: int = 0
+        data: Optional[Union[Dict[str, Any], bytes]] = None,
+        headers: Optional[Dict[str, str]] = None
     ) -> ApiResponse:
-        """Make HTTP request using Playwright page.fetch().
+        """Make HTTP request on the shared APIRequestContext, retrying 429s.
         
         Args:
             method: HTTP method (GET, POST, PUT, PATCH, DELETE)
             endpoint: API endpoint path
-            data: Request body (auto-converted to JSON)
+            data: Request body (dicts are JSON-encoded; bytes are sent as-is)
             headers: Additional headers to send
-            attempt: Current retry attempt number
             
         Returns:
             ApiResponse with status, body, headers, timing
         """
-        # Build URL
-        url = f"{self.BASE_URL}{self.API_PREFIX}/{endpoint}"
+        endpoint = with_trailing_slash(endpoint)
+        bucket = rate_limit_bucket(endpoint)
         
-        # Prepare headers
-        request_headers = headers or {}
-        request_headers["Content-Type"] = "application/json"
+        # Circuit open: answer with a synthetic 429 without a round trip
+        open_for = self._circuit_open_until[bucket] - time.monotonic()
+        if open_for > 0:
+            return ApiResponse(
+                status_code=429,
+                body={},
+                headers={"retry-after": f"{open_for:.3f}"},
+                elapsed_ms=0.0,
+                was_rate_limited=True
+            )
         
-        # Prepare fetch options
-        fetch_options = {
-            "method": method,
-            "headers": request_headers
-        }
+        # Prepare request options; the context already sends DEFAULT_HEADERS,
+        # so only per-call headers are passed (and never modified)
+        fetch_options = {"method": method}
+        if headers:
+            fetch_options["headers"] = headers
         
-        # Add body if present
+        # Add body if present; encoded once and resent as-is on retries
         if data is not None:
-            fetch_options["body"] = json.dumps(data)
+            if not isinstance(data, bytes):
+                data = orjson.dumps(data)
+            fetch_options["data"] = data
         
-        try:
-            # Time the request
-            start_time = time.time()
+        for attempt in range(self.MAX_RETRIES + 1):
+            sent = self._with_auth(fetch_options)
+            api_response = await self._send(endpoint, sent, attempt, bucket)
             
-            # Make request using Playwright
-            response = await self.page.fetch(url, **fetch_options)
+            # Access token expired mid-session: renew it and resend once
+            # (not when the caller sent its own Authorization header)
+            if (api_response.status_code == 401 and self.tokens is not None
+                    and "Authorization" not in (headers or {})):
+                await self.tokens.renew(rejected=sent["headers"]["Authorization"])
+                api_response = await self._send(endpoint, self._with_auth(fetch_options),
+                                                attempt, bucket)
             
-            elapsed_ms = (time.time() - start_time) * 1000
+            if api_response.status_code != 429:
+                # Reset circuit breaker on success
+                self.consecutive_rate_limits[bucket] = 0
+                self._circuit_trips[bucket] = 0
+                return api_response
             
-            # Extract response details
-            status_code = response.status
-            headers_dict = dict(await response.all_headers())
+            # Handle 429 rate limiting
+            backoff_seconds = self._rate_limit_backoff(api_response, attempt, bucket)
+            if backoff_seconds is None:
+                return api_response
             
-            # Parse body as JSON
+            # Wait before retry
+            await self._sleep(backoff_seconds)
+        
+        return api_response
+
+    def _with_auth(self, fetch_options: Dict[str, Any]) -> Dict[str, Any]:
+        """fetch options carrying the current access token, if the client has one.
+
+        Headers passed by the caller win, so a test can still send its own
+        Authorization header.
+        """
+        if self.tokens is None:
+            return fetch_options
+        return {**fetch_options,
+                "headers": {**self.tokens.header, **fetch_options.get("headers", {})}}
+
+    async def _send(self, endpoint: str, fetch_options: Dict[str, Any], attempt: int,
+                    bucket: str) -> ApiResponse:
+        """Send one request and wrap the result; no retry handling."""
+        # Stay inside the bucket's request budget, then wait for a slot;
+        # the limiter adapts how many requests overlap
+        await self._wait_for_rate_window(bucket)
+        limiter = self.limiters[bucket]
+        await limiter.acquire()
+        
+        # Time the request
+        start_ns = time.perf_counter_ns()
+        
+        # Keep-alive connections are pooled inside the request context
+        status_code = elapsed_ms = None
+        try:
+            # The context's base_url resolves the relative endpoint
+            response = await self.request.fetch(endpoint, **fetch_options)
+            status_code = response.status
+            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        finally:
+            # Also on errors and cancellation (a BaseException), or the
+            # slot leaks; without a status the limit is left as it is
+            limiter.release(status_code, elapsed_ms)
+        
+        # Extract response details
+        # Playwright already returns a fresh dict with lowercase names
+        headers_dict = response.headers
+        self._note_rate_limit_headers(headers_dict, bucket)
+        
+        # Parse body as JSON straight from the raw bytes; skip fetching
+        # it at all when there is none or it isn't JSON
+        body = {}
+        if (status_code not in (204, 304)
+                and headers_dict.get("content-length") != "0"
+                and "json" in headers_dict.get("content-type", "")):
             try:
-                body_text = await response.text()
-                body = json.loads(body_text) if body_text else {}
-            except json.JSONDecodeError:
-                body = {}
-            
-            # Create response object
-            api_response = ApiResponse(
-                status_code=status_code,
-                body=body,
-                headers=headers_dict,
-                elapsed_ms=elapsed_ms,
-                retry_count=attempt
+                body_bytes = await response.body()
+                body = orjson.loads(body_bytes) if body_bytes else {}
+            except orjson.JSONDecodeError:
+                pass
+        
+        return ApiResponse(
+            status_code=status_code,
+            body=body,
+            headers=headers_dict,
+            elapsed_ms=elapsed_ms,
+            retry_count=attempt
+        )
+
+    async def _wait_for_rate_window(self, bucket: str):
+        """Sleep until a send fits the bucket's RPM window and any server-hinted pause ends."""
+        send_times = self._send_times[bucket]
+        while True:
+            now = time.monotonic()
+            wait = self._paused_until[bucket] - now
+            if self.RPM_LIMIT is not None:
+                window_start = now - self.RATE_WINDOW_SECONDS
+                while send_times and send_times[0] <= window_start:
+                    send_times.popleft()
+                if len(send_times) >= self.RPM_LIMIT:
+                    wait = max(wait, send_times[0] - window_start)
+            if wait <= 0:
+                break
+            await self._sleep(wait)
+        if self.RPM_LIMIT is not None:
+            send_times.append(time.monotonic())
+
+    def _note_rate_limit_headers(self, headers: Dict[str, str], bucket: str):
+        """Pause future sends when the server says the budget is nearly spent.
+
+        Reads X-RateLimit-Limit/-Remaining/-Reset (lowercase from Playwright);
+        Reset is taken as seconds until the window resets.
+        """
+        try:
+            remaining = int(headers["x-ratelimit-remaining"])
+            limit = int(headers["x-ratelimit-limit"])
+            reset = float(headers["x-ratelimit-reset"])
+        except (KeyError, ValueError):
+            return
+        if remaining < limit * self.RATE_LIMIT_LOW_WATERMARK:
+            self._paused_until[bucket] = max(
+                self._paused_until[bucket],
+                time.monotonic() + min(reset, self.MAX_BACKOFF_SECONDS)
             )
-            
-            # Handle 429 rate limiting
-            if status_code == 429:
-                return await self._handle_rate_limit(
-                    method, endpoint, data, headers, attempt, api_response
-                )
-            
-            # Reset circuit breaker on success
-            self.consecutive_rate_limits = 0
-            
-            return api_response
-            
-        except Exception as e:
-            # Network or parsing error
-            raise Exception(f"API request failed: {str(e)}")
 
-    async def _handle_rate_limit(
-        self,
-        method: str,
-        endpoint: str,
-        data: Optional[Dict[str, Any]],
-        headers: Optional[Dict[str, str]],
-        attempt: int,
-        response: ApiResponse
-    ) -> ApiResponse:
-        """Handle 429 rate limit response with retry logic.
+    def _rate_limit_backoff(self, response: ApiResponse, attempt: int,
+                            bucket: str) -> Optional[float]:
+        """Decide how long to wait after a 429, or None to stop retrying.
         
         Implements:
         - Exponential backoff
-        - Jitter (±20% randomness)
-        - Circuit breaker (fail-fast after N consecutive 429s)
+        - Jitter (±20% randomness) on the exponential backoff only
+        - Circuit breaker (after N consecutive 429s in a bucket, open it for
+          an exponentially growing window)
         - RFC 7231 Retry-After header parsing
         
         Args:
-            method: HTTP method
-            endpoint: API endpoint
-            data: Request body
-            headers: Request headers
-            attempt: Current attempt number
             response: The 429 response
+            attempt: Attempt number that produced it
+            bucket: Rate limit bucket of the endpoint
             
         Returns:
-            ApiResponse (either retry result or final 429)
+            Seconds to sleep before the next attempt, or None (the response
+            is then marked was_rate_limited and returned as-is)
         """
-        self.consecutive_rate_limits += 1
-        self.metrics.record_rate_limit(0)  # Will update with actual backoff
-        
-        # Circuit breaker: fail-fast if too many consecutive 429s
-        if self.consecutive_rate_limits >= self.CIRCUIT_BREAKER_THRESHOLD:
-            response.was_rate_limited = True
-            return response
+        self.consecutive_rate_limits[bucket] += 1
         
-        # Check if max retries exceeded
-        if attempt >= self.MAX_RETRIES:
+        # Circuit breaker: fail-fast and open the circuit if too many
+        # consecutive 429s; otherwise give up once max retries are exceeded
+        if self.consecutive_rate_limits[bucket] >= self.CIRCUIT_BREAKER_THRESHOLD:
+            open_window = min(self.CIRCUIT_OPEN_MAX_SECONDS,
+                              2.0 ** self._circuit_trips[bucket])
+            self._circuit_trips[bucket] += 1
+            self._circuit_open_until[bucket] = time.monotonic() + open_window
+        if (self.consecutive_rate_limits[bucket] >= self.CIRCUIT_BREAKER_THRESHOLD
+                or attempt >= self.MAX_RETRIES):
+            self.metrics.record_rate_limit(0)
             response.was_rate_limited = True
-            return response
+            return None
         
         # Calculate backoff time
         retry_after = response.get_retry_after_seconds()
         
         if retry_after is not None:
-            # Use Retry-After header
+            # Use Retry-After header as-is; the server already chose the wait
             backoff_seconds = min(retry_after, self.MAX_BACKOFF_SECONDS)
         else:
             # Calculate exponential backoff
@@ -403,49 +659,103 @@ class PlaywrightApiClient:
                              (self.BACKOFF_MULTIPLIER ** attempt)
             backoff_seconds = min(backoff_seconds, self.MAX_BACKOFF_SECONDS)
         
-        # Add jitter (±20%) to prevent thundering herd
-        if self.ENABLE_JITTER:
-            jitter = random.uniform(0.8, 1.2)
-            backoff_seconds *= jitter
+            # Add jitter (±20%) to prevent thundering herd
+            if self.ENABLE_JITTER:
+                jitter = random.uniform(0.8, 1.2)
+                backoff_seconds *= jitter
         
-        # Record backoff
+        # Record the final backoff once
+        self.metrics.record_rate_limit(backoff_seconds)
         self.metrics.record_retry()
-        self.metrics.total_backoff_seconds += backoff_seconds
-        
-        # Wait before retry
-        await self.page.wait_for_timeout(backoff_seconds * 1000)
         
-        # Retry the request
-        return await self._make_request(
-            method=method,
-            endpoint=endpoint,
-            data=data,
-            headers=headers,
-            attempt=attempt + 1
-        )
+        return backoff_seconds
 
     async def get(self, endpoint: str, headers: Optional[Dict[str, str]] = None) -> ApiResponse:
-        """GET request."""
-        return await self._make_request("GET", endpoint, headers=headers)
+        """GET request.
+
+        Repeat GETs of an endpoint send the cached ETag as If-None-Match and
+        a 304 is answered from the cached response. Callers that pass their
+        own conditional headers get the raw response instead.
+        """
+        if headers and any(name.lower() in ("if-none-match", "if-modified-since")
+                           for name in headers):
+            return await self._make_request("GET", endpoint, headers=headers)
+
+        cached = self._etag_cache.get(endpoint)
+        if cached is not None:
+            headers = {**(headers or {}), "If-None-Match": cached.headers["etag"]}
+
+        response = await self._make_request("GET", endpoint, headers=headers)
+
+        if response.status_code == 304 and cached is not None:
+            return replace(cached, elapsed_ms=response.elapsed_ms,
+                           retry_count=response.retry_count)
+
+        if response.is_success() and "etag" in response.headers:
+            self._etag_cache[endpoint] = response
+        return response
+
+    # The other verbs are _make_request with the method bound:
+    # post/put/patch(endpoint, data, headers=None), delete(endpoint, headers=None)
+    post = partialmethod(_make_request, "POST")
+    put = partialmethod(_make_request, "PUT")
+    patch = partialmethod(_make_request, "PATCH")
+    delete = partialmethod(_make_request, "DELETE")
+
+    async def batch(
+        self,
+        requests: Iterable[Tuple[str, str, Optional[Union[Dict[str, Any], bytes]]]]
+    ) -> List[ApiResponse]:
+        """Send independent requests concurrently on the shared context.
+
+        Only batch requests that don't depend on each other; there is no
+        ordering between them.
+
+        Args:
+            requests: (method, endpoint, data) tuples; data is None for
+                GET and DELETE. GETs go through get() and its ETag cache.
+
+        Returns:
+            Responses in the same order as `requests`
+        """
+        return list(await asyncio.gather(*(
+            self.get(endpoint) if method.upper() == "GET"
+            else self._make_request(method.upper(), endpoint, data=data)
+            for method, endpoint, data in requests
+        )))
+
 
-    async def post(self, endpoint: str, data: Dict[str, Any], 
-                   headers: Optional[Dict[str, str]] = None) -> ApiResponse:
-        """POST request."""
-        return await self._make_request("POST", endpoint, data=data, headers=headers)
+@lru_cache(maxsize=256)
+def rate_limit_bucket(endpoint: str) -> str:
+    """Bucket an endpoint by its first path segment: "members/5/?x=1" -> "members"."""
+    return endpoint.partition("?")[0].partition("/")[0]
 
-    async def put(self, endpoint: str, data: Dict[str, Any],
-                  headers: Optional[Dict[str, str]] = None) -> ApiResponse:
-        """PUT request."""
-        return await self._make_request("PUT", endpoint, data=data, headers=headers)
 
-    async def patch(self, endpoint: str, data: Dict[str, Any],
-                    headers: Optional[Dict[str, str]] = None) -> ApiResponse:
-        """PATCH request."""
-        return await self._make_request("PATCH", endpoint, data=data, headers=headers)
+@lru_cache(maxsize=256)
+def with_trailing_slash(endpoint: str) -> str:
+    """Add the slash the router's URLs end in: "members/5?x=1" -> "members/5/?x=1".
 
-    async def delete(self, endpoint: str, headers: Optional[Dict[str, str]] = None) -> ApiResponse:
-        """DELETE request."""
-        return await self._make_request("DELETE", endpoint, headers=headers)
+    Django's APPEND_SLASH only redirects GETs; a POST/PUT/PATCH/DELETE
+    without the slash is a 500.
+    """
+    path, sep, query = endpoint.partition("?")
+    if path and not path.endswith("/"):
+        path += "/"
+    return f"{path}{sep}{query}"
+
+
+@lru_cache(maxsize=256)
+def link_to_path(link: str) -> str:
+    """Turn a link from a response into an endpoint for PlaywrightApiClient.
+
+    Drops scheme/host and the API prefix (API_PREFIX), keeps the query string:
+    "http://host/myapp/api_sync/members/?limit=5&offset=5" -> "members/?limit=5&offset=5"
+    """
+    parsed = urlparse(link)
+    path = parsed.path.removeprefix(f"{PlaywrightApiClient.API_PREFIX}/").removeprefix("/")
+    if parsed.query:
+        path += f"?{parsed.query}"
+    return path
 
 
 class BaseApiTestClass:
@@ -464,36 +774,110 @@ class BaseApiTestClass:
     #     self.page = page
     #     self.client = None
 
+    # The client's session-wide metrics, so tests read what _rate_limit_backoff
+    # records; zeroed before each test
+    rate_limit_metrics = PlaywrightApiClient.metrics
+
+    # Course dates and student joining date for seeded records
+    SEED_DATETIME = "2026-01-05T09:00:00Z"
+
+    # The seeded fixtures run on the session loop with the client, and
+    # await their teardown DELETE so no records are left behind
+    @pytest_asyncio.fixture
+    async def seeded_member_id(self):
+        """Create a member (usable as course faculty); deleted afterwards."""
+        payload = MemberRequest(
+            firstname="Seeded",
+            lastname="Member",
+            designation="Test Trainer"
+        ).to_dict()
+
+        response = await self.post("members", payload)
+        ResponseValidator(response).assert_status_code(201)
+        member_id = response.body["id"]
+
+        yield member_id
+
+        await self.delete(f"members/{member_id}")
+
+    @pytest_asyncio.fixture
+    async def seeded_course_id(self, seeded_member_id):
+        """Create a course taught by the seeded member; deleted afterwards."""
+        payload = CourseRequest(
+            coursename="Seeded Course",
+            facultyname_id=seeded_member_id,
+            category=CourseCategory.PROGRAMMING.value,
+            startdate=self.SEED_DATETIME,
+            enddate=self.SEED_DATETIME
+        ).to_dict()
+
+        response = await self.post("courses", payload)
+        ResponseValidator(response).assert_status_code(201)
+        course_id = response.body["id"]
+
+        yield course_id
+
+        await self.delete(f"courses/{course_id}")
+
+    @pytest_asyncio.fixture
+    async def seeded_student_id(self, seeded_course_id):
+        """Create a student on the seeded course; deleted afterwards."""
+        payload = StudentRequest(
+            firstname="Seeded",
+            lastname="Student",
+            doj=self.SEED_DATETIME,
+            course=seeded_course_id
+        ).to_dict()
+
+        response = await self.post("students", payload)
+        ResponseValidator(response).assert_status_code(201)
+        student_id = response.body["id"]
+
+        yield student_id
+
+        await self.delete(f"students/{student_id}")
+
+    @pytest.fixture(autouse=True)
+    def _bind_client(self, request):
+        """Bind an async test's client before any seeded fixture sends a request.
+
+        Resolved up front rather than on first use: the async context it
+        wraps can't be set up from inside a running test. Sync tests can't
+        await the helpers, so they get no client and don't need the server.
+        """
+        self.client = (request.getfixturevalue("playwright_client")
+                       if inspect.iscoroutinefunction(request.function) else None)
+
+    @pytest.fixture(autouse=True)
+    def _reset_metrics(self):
+        """Start each test from zeroed rate limit metrics."""
+        self.rate_limit_metrics.reset()
+        yield
+
+    def validate(self, response: ApiResponse) -> ResponseValidator:
+        """Start a fluent validation chain on a response."""
+        return ResponseValidator(response)
+
     def _get_client(self):
-        """Get or create Playwright API client."""
-        if self.client is None and self.page is not None:
-            self.client = PlaywrightApiClient(self.page)
+        """Get the test's playwright_client.
+
+        Every helper call in a test goes through this one client and the
+        session's pooled request context.
+        """
         return self.client
 
-    async def get(self, endpoint: str, headers: Optional[Dict[str, str]] = None) -> ApiResponse:
-        """GET request."""
-        client = self._get_client()
-        return await client.get(endpoint, headers=headers)
-
-    async def post(self, endpoint: str, data: Dict[str, Any],
-                   headers: Optional[Dict[str, str]] = None) -> ApiResponse:
-        """POST request."""
-        client = self._get_client()
-        return await client.post(endpoint, data=data, headers=headers)
-
-    async def put(self, endpoint: str, data: Dict[str, Any],
-                  headers: Optional[Dict[str, str]] = None) -> ApiResponse:
-        """PUT request."""
-        client = self._get_client()
-        return await client.put(endpoint, data=data, headers=headers)
-
-    async def patch(self, endpoint: str, data: Dict[str, Any],
-                    headers: Optional[Dict[str, str]] = None) -> ApiResponse:
-        """PATCH request."""
-        client = self._get_client()
-        return await client.patch(endpoint, data=data, headers=headers)
-
-    async def delete(self, endpoint: str, headers: Optional[Dict[str, str]] = None) -> ApiResponse:
-        """DELETE request."""
-        client = self._get_client()
-        return await client.delete(endpoint, headers=headers)
+
+def _delegate_to_client(verb: str):
+    """Build a BaseApiTestClass verb that forwards to the test's client."""
+    def request(self, endpoint: str, *args, **kwargs) -> Awaitable[ApiResponse]:
+        return getattr(self._get_client(), verb)(endpoint, *args, **kwargs)
+    request.__name__ = verb
+    request.__qualname__ = f"BaseApiTestClass.{verb}"
+    request.__doc__ = f"{verb.upper()} request; returns the client's coroutine to await."
+    return request
+
+
+# get/post/put/patch/delete take the same arguments as PlaywrightApiClient's
+for _verb in ("get", "post", "put", "patch", "delete"):
+    setattr(BaseApiTestClass, _verb, _delegate_to_client(_verb))
+del _verb
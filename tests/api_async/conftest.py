@@ -47,3 +47,64 @@
 #     )
 #
 #     return client
+
+
+from collections import defaultdict
+
+import pytest
+import pytest_asyncio
+from playwright.async_api import async_playwright
+
+from tests.api_async.base_api_test import AimdLimiter, JwtTokens, PlaywrightApiClient
+from utils.config import TEST_USERNAME, TEST_PASSWORD
+
+
+# PlaywrightApiClient awaits every call, so the context comes from the async
+# API (not the sync `playwright` fixture in tests/conftest.py). Playwright
+# objects are bound to the loop that created them: every async fixture and
+# test here runs on the session loop (see asyncio_default_*_loop_scope in
+# pytest.ini).
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def api_request_context():
+    """One APIRequestContext for the whole session, so connections are reused.
+
+    It carries no credentials; clients add the Bearer token from api_tokens
+    per request, since access tokens expire during a long session.
+    """
+    async with async_playwright() as p:
+        context = await p.request.new_context(
+            base_url=PlaywrightApiClient.API_URL,
+            extra_http_headers=PlaywrightApiClient.DEFAULT_HEADERS
+        )
+        yield context
+        await context.dispose()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def api_tokens(api_request_context):
+    """Token pair for TEST_USERNAME/TEST_PASSWORD (utils/config.py), logged in
+    once and renewed by the clients when the access token expires."""
+    tokens = JwtTokens(api_request_context, TEST_USERNAME, TEST_PASSWORD)
+    await tokens.login()
+    return tokens
+
+
+@pytest.fixture(scope="session")
+def etag_cache():
+    """ETagged GETs kept for the session, so a resource fetched by one test
+    is only revalidated (If-None-Match -> 304) when a later test reads it."""
+    return {}
+
+
+@pytest.fixture(scope="session")
+def rate_limiters():
+    """Per-bucket AIMD limiters for the session, so the in-flight cap adapts
+    to every test's traffic rather than restarting with each client."""
+    return defaultdict(AimdLimiter)
+
+
+@pytest.fixture
+def playwright_client(api_request_context, api_tokens, etag_cache, rate_limiters):
+    """One PlaywrightApiClient per test, shared by every call it makes."""
+    return PlaywrightApiClient(api_request_context, tokens=api_tokens,
+                               etag_cache=etag_cache, limiters=rate_limiters)
@@ -0,0 +1,60 @@
+"""Token handling - the access token expires during long sessions."""
+
+import asyncio
+import pytest
+
+from tests.api_async.base_api_test import JwtTokens, PlaywrightApiClient
+from utils.config import TEST_USERNAME, TEST_PASSWORD
+
+
+class _CountingContext:
+    """Forwards post() to the real context, counting token refreshes."""
+
+    def __init__(self, context):
+        self._context = context
+        self.refreshes = 0
+
+    async def post(self, url, **kwargs):
+        self.refreshes += url == PlaywrightApiClient.TOKEN_REFRESH_URL
+        return await self._context.post(url, **kwargs)
+
+
+async def _stale_tokens(context) -> JwtTokens:
+    tokens = JwtTokens(context, TEST_USERNAME, TEST_PASSWORD)
+    await tokens.login()
+    tokens.access = "stale"  # stands in for an expired access token
+    return tokens
+
+
+@pytest.mark.asyncio
+class TestTokenRenewal:
+    """A 401 renews the access token and the request is resent."""
+
+    async def test_rejected_token_is_renewed(self, api_request_context):
+        tokens = await _stale_tokens(api_request_context)
+        client = PlaywrightApiClient(api_request_context, tokens=tokens)
+
+        resp = await client.get("members")
+
+        assert resp.status_code == 200
+        assert tokens.access != "stale"
+
+    async def test_concurrent_rejections_renew_once(self, api_request_context):
+        counting = _CountingContext(api_request_context)
+        tokens = await _stale_tokens(counting)
+        client = PlaywrightApiClient(api_request_context, tokens=tokens)
+
+        responses = await asyncio.gather(*(client.get(f"members?limit={n}")
+                                           for n in range(1, 5)))
+
+        assert [r.status_code for r in responses] == [200] * 4
+        assert counting.refreshes == 1
+
+    async def test_own_authorization_header_is_not_renewed(self, api_request_context, api_tokens):
+        client = PlaywrightApiClient(api_request_context, tokens=api_tokens)
+        before = api_tokens.access
+
+        resp = await client.get("members", headers={"Authorization": "Bearer invalid"})
+
+        assert resp.status_code == 401
+        assert api_tokens.access == before
@@ -1,6 +1,6 @@
 """Broken Links & HATEOAS Tests - Using Playwright for API Validation
 
-Tests for REST API link integrity using Playwright page.fetch():
+Tests for REST API link integrity using Playwright page.request:
 - Self-referential links (HATEOAS)
 - Pagination links (next, previous, first, last)
 - Related resource links
@@ -13,20 +13,62 @@ Tests for REST API link integrity using Playwright page.fetch():
 Interview-ready REST API best practices testing with Playwright.
 """
 
+import asyncio
+import orjson
 import pytest
-from urllib.parse import urlparse
-from tests.api_async.base_api_test import PlaywrightApiClient
+from collections import deque
+from typing import Iterable, List, Optional
+from tests.api_async.base_api_test import ApiResponse, PlaywrightApiClient, link_to_path
+
+
+# A link is either an absolute URL or a server-relative path
+_VALID_LINK_PREFIXES = ("http://", "https://", "/")
+
+# Paths from the OpenAPI schema (served outside the API prefix), fetched once
+_SCHEMA_PATHS: Optional[List[str]] = None
+
+
+async def _openapi_paths(client: PlaywrightApiClient) -> List[str]:
+    """Paths listed in the project's OpenAPI schema."""
+    global _SCHEMA_PATHS
+    if _SCHEMA_PATHS is None:
+        response = await client.request.get(f"{client.BASE_URL}/schema/?format=json")
+        _SCHEMA_PATHS = list(orjson.loads(await response.body())["paths"])
+    return _SCHEMA_PATHS
+
+
+def _faculty_ids(courses: Iterable[dict]) -> List[int]:
+    """Distinct faculty ids referenced by course rows.
+
+    facultyname_id is write-only; responses carry the faculty embedded as
+    facultyname: {"id": ...}.
+    """
+    return sorted({course["facultyname"]["id"] for course in courses
+                   if course.get("facultyname")})
+
+
+# Cap on in-flight detail GETs so the request context isn't flooded
+_MAX_CONCURRENT_GETS = 16
+
+
+async def _gather_gets(client: PlaywrightApiClient, endpoints: Iterable[str]) -> List[ApiResponse]:
+    """GET independent endpoints concurrently, in the order given."""
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_GETS)
+
+    async def fetch(endpoint):
+        async with semaphore:
+            return await client.get(endpoint)
+
+    return await asyncio.gather(*(fetch(endpoint) for endpoint in endpoints))
 
 
 @pytest.mark.asyncio
 class TestHATEOASLinks:
     """Test HATEOAS (Hypermedia As The Engine Of Application State) links."""
 
-    async def test_list_endpoints_have_self_links(self, page):
+    async def test_list_endpoints_have_self_links(self, playwright_client):
         """Test: List endpoints include self links in responses."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("members")
+        resp = await playwright_client.get("members")
         
         assert resp.is_success()
         results = resp.body.get("results", [])
@@ -40,12 +82,10 @@ class TestHATEOASLinks:
             assert member.get("url") or member.get("uri") or member.get("self"), \
                 "Member missing self link/URL"
 
-    async def test_detail_endpoint_returns_self_link(self, page):
+    async def test_detail_endpoint_returns_self_link(self, playwright_client):
         """Test: Detail endpoints include self link."""
-        client = PlaywrightApiClient(page)
-        
         # Get a member
-        list_resp = await client.get("members")
+        list_resp = await playwright_client.get("members")
         
         if not list_resp.body.get("results"):
             pytest.skip("No members available")
@@ -54,18 +94,16 @@ class TestHATEOASLinks:
         member_id = member.get("id")
         
         # Get detail
-        detail_resp = await client.get(f"members/{member_id}")
+        detail_resp = await playwright_client.get(f"members/{member_id}")
         
         # Should have self link or URL
         assert detail_resp.body.get("url") or \
                detail_resp.body.get("uri") or \
                detail_resp.body.get("self")
 
-    async def test_related_resources_have_links(self, page):
+    async def test_related_resources_have_links(self, playwright_client):
         """Test: Related resources are discoverable via links."""
-        client = PlaywrightApiClient(page)
-        
-        courses_resp = await client.get("courses")
+        courses_resp = await playwright_client.get("courses")
         
         if not courses_resp.body.get("results"):
             pytest.skip("No courses available")
@@ -76,11 +114,9 @@ class TestHATEOASLinks:
         assert course.get("facultyname") or course.get("facultyname_id") or \
                course.get("faculty_url")
 
-    async def test_links_are_absolute_urls(self, page):
+    async def test_links_are_absolute_urls(self, playwright_client):
         """Test: All links are absolute URLs or valid paths."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("members")
+        resp = await playwright_client.get("members")
         
         results = resp.body.get("results", [])
         
@@ -95,14 +131,12 @@ class TestHATEOASLinks:
             for link in links_to_check:
                 if link:
                     # Should start with http/https or /
-                    assert link.startswith(("http://", "https://", "/")), \
+                    assert link.startswith(_VALID_LINK_PREFIXES), \
                         f"Invalid link format: {link}"
 
-    async def test_self_link_navigation(self, page):
+    async def test_self_link_navigation(self, playwright_client):
         """Test: Can navigate using self links from list."""
-        client = PlaywrightApiClient(page)
-        
-        list_resp = await client.get("members")
+        list_resp = await playwright_client.get("members")
         
         if not list_resp.body.get("results"):
             pytest.skip("No members available")
@@ -111,54 +145,43 @@ class TestHATEOASLinks:
         self_link = member.get("url") or member.get("uri")
         
         if self_link:
-            # Extract path from URL
-            parsed = urlparse(self_link)
-            path = parsed.path
-            
-            # Remove /api_async prefix if present and query
-            if path.startswith("/"):
-                path = path[1:]  # Remove leading /
-            
-            if path.startswith("api_async/"):
-                path = path[4:]  # Remove api_async/ prefix
-            
             # Navigate using the link
-            resp = await client.get(path)
+            resp = await playwright_client.get(link_to_path(self_link))
             
             # Should be successful
             assert resp.status_code in [200, 404], \
                 f"Unexpected status for self link: {resp.status_code}"
 
-    async def test_no_broken_internal_links(self, page):
+    async def test_no_broken_internal_links(self, playwright_client):
         """Test: All resource IDs referenced exist."""
-        client = PlaywrightApiClient(page)
-        
-        courses_resp = await client.get("courses")
+        courses_resp = await playwright_client.get("courses")
         
         if not courses_resp.body.get("results"):
             pytest.skip("No courses available")
         
-        for course in courses_resp.body["results"]:
-            faculty_id = course.get("facultyname_id")
-            
-            if faculty_id:
-                # Try to fetch the referenced faculty
-                faculty_resp = await client.get(f"members/{faculty_id}")
-                
-                # Should exist (200) not 404
-                assert faculty_resp.status_code != 404, \
-                    f"Course references non-existent faculty {faculty_id}"
+        # Many courses share a faculty; check each one once
+        faculty_ids = _faculty_ids(courses_resp.body["results"])
+        assert faculty_ids, "Courses listed but no faculty ids found"
+        
+        # Try to fetch the referenced faculty
+        faculty_resps = await _gather_gets(
+            playwright_client, [f"members/{faculty_id}" for faculty_id in faculty_ids])
+        
+        # Should exist (200) not 404; report every broken reference at once
+        failures = [f"Course references non-existent faculty {faculty_id}"
+                    for faculty_id, faculty_resp in zip(faculty_ids, faculty_resps)
+                    if faculty_resp.status_code == 404]
+        if failures:
+            pytest.fail("\n".join(failures))
 
 
 @pytest.mark.asyncio
 class TestPaginationLinks:
     """Test pagination link structure and validity."""
 
-    async def test_paginated_response_has_pagination_links(self, page):
+    async def test_paginated_response_has_pagination_links(self, playwright_client):
         """Test: Paginated responses include next/previous links."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("members?limit=5")
+        resp = await playwright_client.get("members?limit=5")
         
         assert resp.is_success()
         
@@ -171,11 +194,9 @@ class TestPaginationLinks:
         assert has_next or has_prev or has_count, \
             "Missing pagination metadata"
 
-    async def test_pagination_link_validity(self, page):
+    async def test_pagination_link_validity(self, playwright_client):
         """Test: Next/previous links are valid URLs."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("members?limit=5")
+        resp = await playwright_client.get("members?limit=5")
         
         if not resp.is_success():
             pytest.skip("Cannot get paginated members")
@@ -187,14 +208,12 @@ class TestPaginationLinks:
             if link:
                 # Should be URL format
                 assert isinstance(link, str), "Link should be string"
-                assert link.startswith(("http://", "https://", "/")), \
+                assert link.startswith(_VALID_LINK_PREFIXES), \
                     f"Link not URL format: {link}"
 
-    async def test_pagination_follow_next_link(self, page):
+    async def test_pagination_follow_next_link(self, playwright_client):
         """Test: Can follow next link to get next page."""
-        client = PlaywrightApiClient(page)
-        
-        resp1 = await client.get("members?limit=5")
+        resp1 = await playwright_client.get("members?limit=5")
         
         if not resp1.body.get("results"):
             pytest.skip("No members available")
@@ -202,28 +221,14 @@ class TestPaginationLinks:
         next_link = resp1.body.get("next")
         
         if next_link:
-            # Extract path and query
-            parsed = urlparse(next_link)
-            path_with_query = parsed.path
-            if parsed.query:
-                path_with_query += f"?{parsed.query}"
-            
-            # Remove /api_async prefix
-            if path_with_query.startswith("/api_async/"):
-                path_with_query = path_with_query[5:]
-            elif path_with_query.startswith("/"):
-                path_with_query = path_with_query[1:]
-            
             # Navigate to next page
-            resp2 = await client.get(path_with_query)
+            resp2 = await playwright_client.get(link_to_path(next_link))
             
             assert resp2.is_success()
 
-    async def test_pagination_links_are_consistent(self, page):
+    async def test_pagination_links_are_consistent(self, playwright_client):
         """Test: Pagination follows expected pattern."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("members?limit=10&offset=0")
+        resp = await playwright_client.get("members?limit=10&offset=0")
         
         if not resp.is_success():
             pytest.skip("Cannot get paginated response")
@@ -236,11 +241,9 @@ class TestPaginationLinks:
         if count > 10:
             assert next_link, "Should have next link when more items exist"
 
-    async def test_pagination_offset_increments_correctly(self, page):
+    async def test_pagination_offset_increments_correctly(self, playwright_client):
         """Test: Offset parameter increments in pagination links."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("members?limit=5&offset=0")
+        resp = await playwright_client.get("members?limit=5&offset=0")
         
         next_link = resp.body.get("next")
         
@@ -250,25 +253,23 @@ class TestPaginationLinks:
                    "cursor=" in next_link, \
                    "Pagination link missing offset/page/cursor"
 
-    async def test_last_page_has_no_next_link(self, page):
+    async def test_last_page_has_no_next_link(self, playwright_client):
         """Test: Last page doesn't have next link."""
-        client = PlaywrightApiClient(page)
+        # Read the total from a 1-row page, then fetch only the last row
+        count_resp = await playwright_client.get("members?limit=1")
+        count = count_resp.body.get("count", 0)
         
-        # Get a page that's likely last
-        resp = await client.get("members?limit=1000")
+        resp = await playwright_client.get(f"members?limit=1&offset={max(count - 1, 0)}")
         
         next_link = resp.body.get("next")
         
         # Last page shouldn't have next
-        if resp.body.get("count", 0) <= 1000:
-            assert next_link is None or next_link == "", \
-                "Last page shouldn't have next link"
+        assert next_link is None or next_link == "", \
+            "Last page shouldn't have next link"
 
-    async def test_first_page_has_no_previous_link(self, page):
+    async def test_first_page_has_no_previous_link(self, playwright_client):
         """Test: First page doesn't have previous link."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("members?offset=0")
+        resp = await playwright_client.get("members?offset=0")
         
         prev_link = resp.body.get("previous")
         
@@ -281,67 +282,70 @@ class TestPaginationLinks:
 class TestLinkValidity:
     """Test that all links in responses are valid and navigable."""
 
-    async def test_all_member_links_are_valid(self, page):
+    async def test_all_member_links_are_valid(self, playwright_client):
         """Test: All links returned in member list are navigable."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("members")
+        resp = await playwright_client.get("members")
         
         if not resp.body.get("results"):
             pytest.skip("No members available")
         
-        for member in resp.body["results"]:
-            member_id = member.get("id")
-            
-            # Try to navigate to member
-            detail_resp = await client.get(f"members/{member_id}")
-            
-            # Should not return 404
-            assert detail_resp.status_code != 404, \
-                f"Member link {member_id} returned 404"
+        member_ids = [member.get("id") for member in resp.body["results"]]
+        
+        # Try to navigate to each member
+        detail_resps = await _gather_gets(
+            playwright_client, [f"members/{member_id}" for member_id in member_ids])
+        
+        # Should not return 404; report every broken link at once
+        failures = [f"Member link {member_id} returned 404"
+                    for member_id, detail_resp in zip(member_ids, detail_resps)
+                    if detail_resp.status_code == 404]
+        if failures:
+            pytest.fail("\n".join(failures))
 
-    async def test_all_course_links_are_valid(self, page):
+    async def test_all_course_links_are_valid(self, playwright_client):
         """Test: All course links are navigable."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("courses")
+        resp = await playwright_client.get("courses")
         
         if not resp.body.get("results"):
             pytest.skip("No courses available")
         
-        for course in resp.body["results"]:
-            course_id = course.get("id")
-            
-            detail_resp = await client.get(f"courses/{course_id}")
-            
-            assert detail_resp.status_code != 404, \
-                f"Course link {course_id} returned 404"
+        course_ids = [course.get("id") for course in resp.body["results"]]
+        
+        detail_resps = await _gather_gets(
+            playwright_client, [f"courses/{course_id}" for course_id in course_ids])
+        
+        failures = [f"Course link {course_id} returned 404"
+                    for course_id, detail_resp in zip(course_ids, detail_resps)
+                    if detail_resp.status_code == 404]
+        if failures:
+            pytest.fail("\n".join(failures))
 
-    async def test_related_faculty_links_are_valid(self, page):
+    async def test_related_faculty_links_are_valid(self, playwright_client):
         """Test: Faculty links from courses are valid."""
-        client = PlaywrightApiClient(page)
-        
-        courses_resp = await client.get("courses")
+        courses_resp = await playwright_client.get("courses")
         
         if not courses_resp.body.get("results"):
             pytest.skip("No courses available")
         
-        for course in courses_resp.body["results"]:
-            faculty_id = course.get("facultyname_id")
-            
-            if faculty_id:
-                faculty_resp = await client.get(f"members/{faculty_id}")
-                
-                # Faculty should exist
-                assert faculty_resp.status_code == 200, \
-                    f"Faculty {faculty_id} from course not found"
+        # Many courses share a faculty; check each one once
+        faculty_ids = _faculty_ids(courses_resp.body["results"])
+        assert faculty_ids, "Courses listed but no faculty ids found"
+        
+        faculty_resps = await _gather_gets(
+            playwright_client, [f"members/{faculty_id}" for faculty_id in faculty_ids])
+        
+        # Faculty should exist
+        failures = [f"Faculty {faculty_id} from course not found"
+                    for faculty_id, faculty_resp in zip(faculty_ids, faculty_resps)
+                    if faculty_resp.status_code != 200]
+        if failures:
+            pytest.fail("\n".join(failures))
 
-    async def test_update_returns_valid_self_link(self, page):
+    @pytest.mark.serial
+    async def test_update_returns_valid_self_link(self, playwright_client):
         """Test: After update, returned resource has valid self link."""
-        client = PlaywrightApiClient(page)
-        
         # Get a member
-        list_resp = await client.get("members")
+        list_resp = await playwright_client.get("members")
         
         if not list_resp.body.get("results"):
             pytest.skip("No members available")
@@ -349,55 +353,62 @@ class TestLinkValidity:
         member = list_resp.body["results"][0]
         member_id = member.get("id")
         
-        # Update it
-        update_resp = await client.put(f"members/{member_id}", {
+        # Update it, putting the original name back afterwards
+        update_resp = await playwright_client.put(f"members/{member_id}", {
             "firstname": "Updated",
-            "lastname": member.get("lastname", "Test"),
-            "designation": member.get("designation", "Dev"),
-            "image": ""
+            "lastname": member["lastname"],
+            "designation": member["designation"],
         })
-        
-        if update_resp.is_success():
-            # Response should have valid self link
+        try:
+            assert update_resp.status_code == 200, update_resp.body
+            
+            # The PUT response is the updated resource; no need to re-fetch it
+            assert update_resp.body.get("id") == member_id
+            assert update_resp.body.get("firstname") == "Updated"
+            
+            # Response self link, if any, should point back at this member
             self_link = update_resp.body.get("url") or update_resp.body.get("uri")
             
             if self_link:
-                # Navigate to it
-                nav_resp = await client.get(self_link.lstrip("/api_async/").lstrip("/"))
-                assert nav_resp.is_success()
-
-    async def test_created_resource_location_header(self, page):
+                assert link_to_path(self_link).rstrip("/") == f"members/{member_id}", \
+                    f"Self link {self_link} does not point at member {member_id}"
+        finally:
+            await playwright_client.put(f"members/{member_id}", {
+                "firstname": member["firstname"],
+                "lastname": member["lastname"],
+                "designation": member["designation"],
+            })
+
+    async def test_created_resource_location_header(self, playwright_client):
         """Test: POST response has Location header with resource URL."""
-        client = PlaywrightApiClient(page)
-        
-        create_resp = await client.post("members", {
+        create_resp = await playwright_client.post("members", {
             "firstname": "LocationTest",
             "lastname": "Member",
             "designation": "Dev",
-            "image": ""
         })
+        assert create_resp.status_code == 201, create_resp.body
         
-        if create_resp.is_success():
+        try:
             # Should have Location header or be in response
-            location = create_resp.headers.get("Location")
+            location = create_resp.headers.get("location")
             resource_url = create_resp.body.get("url") or \
                           create_resp.body.get("uri")
             
             # At least one should exist
             assert location or resource_url, \
                 "Missing location info for created resource"
+        finally:
+            await playwright_client.delete(f"members/{create_resp.body['id']}")
 
 
 @pytest.mark.asyncio
 class TestLinkConsistency:
     """Test link consistency across responses."""
 
-    async def test_same_resource_has_consistent_link(self, page):
+    async def test_same_resource_has_consistent_link(self, playwright_client):
         """Test: Same resource shows consistent link in different responses."""
-        client = PlaywrightApiClient(page)
-        
         # Get member from list
-        list_resp = await client.get("members")
+        list_resp = await playwright_client.get("members")
         
         if not list_resp.body.get("results"):
             pytest.skip("No members available")
@@ -406,43 +417,32 @@ class TestLinkConsistency:
         member_id = member_from_list.get("id")
         list_link = member_from_list.get("url")
         
-        # Get same member from detail
-        detail_resp = await client.get(f"members/{member_id}")
-        detail_link = detail_resp.body.get("url")
-        
-        # Links should match or be equivalent
-        if list_link and detail_link:
-            assert list_link == detail_link, \
+        # The detail endpoint for this member is known, so compare against
+        # it directly instead of fetching the detail response
+        if list_link:
+            assert link_to_path(list_link).rstrip("/") == f"members/{member_id}", \
                 "Member links differ between list and detail"
 
-    async def test_nested_links_are_consistent(self, page):
+    async def test_nested_links_are_consistent(self, playwright_client):
         """Test: Embedded resource links match navigation."""
-        client = PlaywrightApiClient(page)
-        
-        courses_resp = await client.get("courses")
+        courses_resp = await playwright_client.get("courses")
         
         if not courses_resp.body.get("results"):
             pytest.skip("No courses available")
         
         course = courses_resp.body["results"][0]
-        faculty_id = course.get("facultyname_id")
-        
-        if faculty_id:
-            # Get faculty from embed or via link
-            if isinstance(course.get("facultyname"), dict):
-                embedded_faculty = course["facultyname"]
-            else:
-                faculty_resp = await client.get(f"members/{faculty_id}")
-                embedded_faculty = faculty_resp.body
-            
-            # IDs should match
-            assert embedded_faculty.get("id") == faculty_id
+        embedded_faculty = course["facultyname"]
+        
+        # The embedded faculty should match the member it points to
+        faculty_resp = await playwright_client.get(f"members/{embedded_faculty['id']}")
+        assert faculty_resp.status_code == 200
+        for key, value in embedded_faculty.items():
+            assert faculty_resp.body.get(key) == value, \
+                f"Embedded faculty {key} differs from members/{embedded_faculty['id']}"
 
-    async def test_link_format_is_consistent(self, page):
+    async def test_link_format_is_consistent(self, playwright_client):
         """Test: All links follow same format/pattern."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("members")
+        resp = await playwright_client.get("members")
         
         results = resp.body.get("results", [])
         
@@ -466,48 +466,39 @@ class TestLinkConsistency:
 class TestBrokenLinkScenarios:
     """Test handling of broken link scenarios."""
 
-    async def test_404_on_invalid_resource_id(self, page):
+    async def test_404_on_invalid_resource_id(self, playwright_client):
         """Test: Invalid resource ID returns 404."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("members/999999999")
+        resp = await playwright_client.get("members/999999999")
         
         # Should return 404 or similar error
         assert resp.status_code == 404, \
             f"Expected 404 for invalid ID, got {resp.status_code}"
 
-    async def test_404_on_deleted_resource_link(self, page):
+    async def test_404_on_deleted_resource_link(self, playwright_client):
         """Test: After deletion, resource link returns 404."""
-        client = PlaywrightApiClient(page)
-        
         # Create then delete
-        create_resp = await client.post("members", {
+        create_resp = await playwright_client.post("members", {
             "firstname": "DeleteTest",
             "lastname": "Link",
             "designation": "Dev",
-            "image": ""
         })
-        
-        if not create_resp.is_success():
-            pytest.skip("Cannot create test resource")
+        assert create_resp.status_code == 201, create_resp.body
         
         member_id = create_resp.body.get("id")
         
         # Delete it
-        await client.delete(f"members/{member_id}")
+        await playwright_client.delete(f"members/{member_id}")
         
         # Try to access link
-        resp = await client.get(f"members/{member_id}")
+        resp = await playwright_client.get(f"members/{member_id}")
         
         # Should return 404
         assert resp.status_code == 404, \
             f"Deleted resource should return 404, got {resp.status_code}"
 
-    async def test_no_circular_links(self, page):
+    async def test_no_circular_links(self, playwright_client):
         """Test: Links don't form infinite loops."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("members?limit=1")
+        resp = await playwright_client.get("members?limit=1")
         
         results = resp.body.get("results", [])
         
@@ -515,83 +506,78 @@ class TestBrokenLinkScenarios:
             pytest.skip("No results to check")
         
         member = results[0]
-        visited = set()
         
-        def check_circular(obj, depth=0):
-            if depth > 5:
-                return False  # Stopped recursion limit
-            
-            if isinstance(obj, dict):
-                for k, v in obj.items():
-                    if k == "id":
-                        if v in visited:
+        def check_circular(obj):
+            # Walk breadth-first; each entry carries the ids seen on its own
+            # path, so sibling objects sharing an id are not a cycle
+            queue = deque([(obj, 0, frozenset())])
+            while queue:
+                node, depth, seen = queue.popleft()
+                if depth > 5:
+                    continue  # Stopped depth limit
+                
+                if isinstance(node, dict):
+                    node_id = node.get("id")
+                    if node_id is not None:
+                        if node_id in seen:
                             return True  # Circular reference
-                        visited.add(v)
-                    elif isinstance(v, (dict, list)):
-                        if check_circular(v, depth + 1):
-                            return True
+                        seen = seen | {node_id}
+                    children = node.values()
+                elif isinstance(node, list):
+                    children = node
+                else:
+                    continue
+                
+                for child in children:
+                    if isinstance(child, (dict, list)):
+                        queue.append((child, depth + 1, seen))
             
             return False
         
         # Should not have circular references
         assert not check_circular(member), "Circular links detected"
 
-    async def test_404_response_structure(self, page):
+    async def test_404_response_structure(self, playwright_client):
         """Test: 404 errors have consistent structure."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("members/invalid999")
+        resp = await playwright_client.get("members/invalid999")
         
         if resp.status_code == 404:
             # Should have error info
             assert resp.body is not None, "404 should have response body"
 
-    async def test_all_available_endpoints_are_discoverable(self, page):
-        """Test: Can discover all endpoints from root or working_docs."""
-        client = PlaywrightApiClient(page)
+    async def test_all_available_endpoints_are_discoverable(self, playwright_client):
+        """Test: Endpoints used by these tests are listed in the OpenAPI schema."""
+        schema_paths = await _openapi_paths(playwright_client)
         
-        # Try to get API root or documentation
-        resp = await client.get("")
+        # Collection endpoints end in the resource name, e.g. /.../members/
+        resources = {path.rstrip("/").rsplit("/", 1)[-1]
+                     for path in schema_paths if "{" not in path}
         
-        # Most APIs have root endpoint with available endpoints
-        # or documentation showing available links
-        if resp.is_success():
-            assert resp.body is not None
+        for endpoint in ("members", "courses"):
+            assert endpoint in resources, \
+                f"{endpoint} not discoverable from the OpenAPI schema"
 
 
 @pytest.mark.asyncio
 class TestLinkMetadata:
     """Test link metadata and HTTP standards compliance."""
 
-    async def test_links_use_correct_http_methods(self, page):
-        """Test: Response indicates correct methods for links."""
-        client = PlaywrightApiClient(page)
+    @pytest.mark.parametrize("endpoint", ["members", "courses"])
+    async def test_endpoint_sanity(self, playwright_client, endpoint):
+        """Test: List and first detail are GETtable JSON with a Content-Type."""
+        resp = await playwright_client.get(endpoint)
         
-        resp = await client.get("members")
+        assert resp.is_success()
+        assert isinstance(resp.body, dict)
         
         if not resp.body.get("results"):
-            pytest.skip("No members available")
+            pytest.skip(f"No {endpoint} available")
         
-        member = resp.body["results"][0]
+        item = resp.body["results"][0]
         
-        # Should be able to GET detail
-        detail_resp = await client.get(f"members/{member.get('id')}")
+        # Should be able to GET detail, and it should say what it returns
+        detail_resp = await playwright_client.get(f"{endpoint}/{item.get('id')}")
         assert detail_resp.is_success()
-
-    async def test_returned_content_matches_link_type(self, page):
-        """Test: Following links returns expected content type."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("members")
-        
-        if not resp.body.get("results"):
-            pytest.skip("No members available")
-        
-        member = resp.body["results"][0]
-        
-        # Navigate to detail
-        detail_resp = await client.get(f"members/{member.get('id')}")
-        
-        # Should return JSON (or whatever content type)
-        assert detail_resp.headers.get("Content-Type"), \
+        assert isinstance(detail_resp.body, dict)
+        assert detail_resp.headers.get("content-type"), \
             "Response should have Content-Type header"
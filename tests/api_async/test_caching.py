@@ -1,6 +1,6 @@
 """Caching Tests - Using Playwright for API Validation
 
-Tests for HTTP caching behavior using Playwright page.fetch():
+Tests for HTTP caching behavior using Playwright's APIRequestContext:
 - Cache-Control header validation
 - ETag-based conditional requests
 - 304 Not Modified responses
@@ -12,77 +12,83 @@ RFC 7234 Hypertext Transfer Protocol (HTTP/1.1) Caching
 RFC 7232 HTTP/1.1 Conditional Requests (ETags)
 """
 
+import asyncio
+import re
 import pytest
+import pytest_asyncio
+
 from tests.api_async.base_api_test import PlaywrightApiClient
 
+# Cache-Control parsing, compiled once
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+# One match per directive: (name, "=value" or "")
+_DIRECTIVE_RE = re.compile(r"([a-zA-Z-]+)(=[^,]*)?")
+_VALID_DIRECTIVES = frozenset((
+    "public", "private", "max-age", "must-revalidate", "no-cache", "no-store"
+))
+
+
+@pytest_asyncio.fixture(scope="class")
+async def members_list(api_request_context, api_tokens):
+    """One GET of the members list, shared by the read-only tests of a class.
+
+    Tests that mutate members, or need a "before" snapshot taken right
+    before their own change, fetch their own copy instead.
+    """
+    return await PlaywrightApiClient(api_request_context, tokens=api_tokens).get("members")
+
 
 @pytest.mark.asyncio
 class TestCacheControlHeaders:
     """Test Cache-Control header presence and validity."""
 
-    async def test_cache_control_header_present_on_list(self, page):
+    async def test_cache_control_header_present_on_list(self, members_list):
         """Test: List endpoints include Cache-Control header."""
-        client = PlaywrightApiClient(page)
-        resp = await client.get("members")
-        
-        assert resp.is_success()
-        assert resp.headers.get("Cache-Control") or resp.headers.get("cache-control"), \
+        assert members_list.is_success()
+        assert members_list.headers.get("cache-control"), \
             "Missing Cache-Control header"
 
-    async def test_cache_control_header_present_on_detail(self, page):
+    async def test_cache_control_header_present_on_detail(self, playwright_client, members_list):
         """Test: Detail endpoints include Cache-Control header."""
-        client = PlaywrightApiClient(page)
-        
-        list_resp = await client.get("members")
-        if not list_resp.body.get("results"):
+        if not members_list.body.get("results"):
             pytest.skip("No members available")
         
-        member_id = list_resp.body["results"][0].get("id")
-        detail_resp = await client.get(f"members/{member_id}")
+        member_id = members_list.body["results"][0].get("id")
+        detail_resp = await playwright_client.get(f"members/{member_id}")
         
-        assert detail_resp.headers.get("Cache-Control") or detail_resp.headers.get("cache-control")
+        assert detail_resp.headers.get("cache-control")
 
-    async def test_cache_control_max_age_format(self, page):
+    async def test_cache_control_max_age_format(self, members_list):
         """Test: Cache-Control max-age is valid."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("members")
-        cache_control = resp.headers.get("Cache-Control") or resp.headers.get("cache-control")
+        cache_control = members_list.headers.get("cache-control")
         
         if cache_control and "max-age" in cache_control:
             # Extract max-age value
-            import re
-            match = re.search(r"max-age=(\d+)", cache_control)
+            match = _MAX_AGE_RE.search(cache_control)
             assert match, "max-age format invalid"
             max_age = int(match.group(1))
             assert max_age >= 0, "max-age must be non-negative"
 
-    async def test_cache_control_directives_valid(self, page):
+    async def test_cache_control_directives_valid(self, members_list):
         """Test: Cache-Control directives are valid."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("members")
-        cache_control = resp.headers.get("Cache-Control") or resp.headers.get("cache-control")
+        cache_control = members_list.headers.get("cache-control")
         
         if cache_control:
             # Valid directives
-            valid = {"public", "private", "max-age", "must-revalidate", "no-cache", "no-store"}
-            parts = [p.strip() for p in cache_control.split(",")]
-            
-            for part in parts:
-                directive = part.split("=")[0].strip()
-                assert directive.lower() in valid or "=" in part, \
+            # Directive names are case-insensitive; fold the header once
+            for directive, value in _DIRECTIVE_RE.findall(cache_control.lower()):
+                assert directive in _VALID_DIRECTIVES or value, \
                     f"Invalid Cache-Control directive: {directive}"
 
-    async def test_cache_control_consistency_across_requests(self, page):
+    async def test_cache_control_consistency_across_requests(self, playwright_client):
         """Test: Same endpoint returns consistent Cache-Control."""
-        client = PlaywrightApiClient(page)
-        
-        resp1 = await client.get("members?limit=5")
-        cache1 = resp1.headers.get("Cache-Control")
-        
-        resp2 = await client.get("members?limit=5")
-        cache2 = resp2.headers.get("Cache-Control")
+        # Independent requests; send them together
+        resp1, resp2 = await asyncio.gather(
+            playwright_client.get("members?limit=5"),
+            playwright_client.get("members?limit=5"),
+        )
+        cache1 = resp1.headers.get("cache-control")
+        cache2 = resp2.headers.get("cache-control")
         
         assert cache1 == cache2, "Cache-Control should be consistent"
 
@@ -91,21 +97,15 @@ class TestCacheControlHeaders:
 class TestETagHeader:
     """Test ETag header generation and validity."""
 
-    async def test_etag_header_present(self, page):
+    async def test_etag_header_present(self, members_list):
         """Test: ETag header is present on responses."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("members")
-        assert resp.is_success()
-        etag = resp.headers.get("ETag") or resp.headers.get("etag")
+        assert members_list.is_success()
+        etag = members_list.headers.get("etag")
         assert etag, "ETag header missing"
 
-    async def test_etag_format_is_valid(self, page):
+    async def test_etag_format_is_valid(self, members_list):
         """Test: ETag format is valid."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("members")
-        etag = resp.headers.get("ETag") or resp.headers.get("etag")
+        etag = members_list.headers.get("etag")
         
         if etag:
             # Should be quoted string or weak ETag
@@ -113,64 +113,55 @@ class TestETagHeader:
                 f"Invalid ETag format: {etag}"
             assert etag.endswith('"'), f"ETag not properly quoted: {etag}"
 
-    async def test_etag_uniqueness_across_resources(self, page):
+    async def test_etag_uniqueness_across_resources(self, playwright_client, members_list):
         """Test: Different resources have different ETags."""
-        client = PlaywrightApiClient(page)
+        resp2 = await playwright_client.get("courses")
         
-        resp1 = await client.get("members")
-        resp2 = await client.get("courses")
-        
-        etag1 = resp1.headers.get("ETag")
-        etag2 = resp2.headers.get("ETag")
+        etag1 = members_list.headers.get("etag")
+        etag2 = resp2.headers.get("etag")
         
         if etag1 and etag2:
             assert etag1 != etag2, "Different resources should have different ETags"
 
-    async def test_etag_stability_on_repeated_requests(self, page):
+    async def test_etag_stability_on_repeated_requests(self, playwright_client, members_list):
         """Test: Same resource returns same ETag."""
-        client = PlaywrightApiClient(page)
-        
-        list_resp = await client.get("members")
-        if not list_resp.body.get("results"):
+        if not members_list.body.get("results"):
             pytest.skip("No members available")
         
-        member_id = list_resp.body["results"][0].get("id")
-        
-        # Get same member twice
-        resp1 = await client.get(f"members/{member_id}")
-        etag1 = resp1.headers.get("ETag")
+        member_id = members_list.body["results"][0].get("id")
         
-        resp2 = await client.get(f"members/{member_id}")
-        etag2 = resp2.headers.get("ETag")
+        # Get same member twice, concurrently
+        resp1, resp2 = await asyncio.gather(
+            playwright_client.get(f"members/{member_id}"),
+            playwright_client.get(f"members/{member_id}"),
+        )
+        etag1 = resp1.headers.get("etag")
+        etag2 = resp2.headers.get("etag")
         
         assert etag1 == etag2, "ETag should remain stable for unchanged resource"
 
-    async def test_etag_changes_on_update(self, page):
+    async def test_etag_changes_on_update(self, playwright_client, members_list):
         """Test: ETag changes when resource is updated."""
-        client = PlaywrightApiClient(page)
-        
-        list_resp = await client.get("members")
-        if not list_resp.body.get("results"):
+        if not members_list.body.get("results"):
             pytest.skip("No members available")
         
-        member = list_resp.body["results"][0]
+        member = members_list.body["results"][0]
         member_id = member.get("id")
         
         # Get original ETag
-        resp1 = await client.get(f"members/{member_id}")
-        etag_before = resp1.headers.get("ETag")
+        resp1 = await playwright_client.get(f"members/{member_id}")
+        etag_before = resp1.headers.get("etag")
         
         # Update member
-        await client.put(f"members/{member_id}", {
+        await playwright_client.put(f"members/{member_id}", {
             "firstname": "Updated",
             "lastname": member.get("lastname", "Test"),
-            "designation": member.get("designation", "Dev"),
-            "image": ""
+            "designation": member.get("designation", "Dev")
         })
         
         # Get new ETag
-        resp2 = await client.get(f"members/{member_id}")
-        etag_after = resp2.headers.get("ETag")
+        resp2 = await playwright_client.get(f"members/{member_id}")
+        etag_after = resp2.headers.get("etag")
         
         if etag_before and etag_after:
             assert etag_before != etag_after, "ETag should change on update"
@@ -180,17 +171,15 @@ class TestETagHeader:
 class TestConditionalRequests:
     """Test conditional GET requests using If-None-Match."""
 
-    async def test_if_none_match_returns_304(self, page):
+    async def test_if_none_match_returns_304(self, playwright_client):
         """Test: If-None-Match with matching ETag returns 304."""
-        client = PlaywrightApiClient(page)
-        
         # Get resource with ETag
-        resp1 = await client.get("members?limit=1")
-        etag = resp1.headers.get("ETag")
+        resp1 = await playwright_client.get("members?limit=1")
+        etag = resp1.headers.get("etag")
         
         if etag:
             # Send If-None-Match header
-            resp2 = await client.get(
+            resp2 = await playwright_client.get(
                 "members?limit=1",
                 headers={"If-None-Match": etag}
             )
@@ -199,16 +188,13 @@ class TestConditionalRequests:
             assert resp2.status_code in [200, 304], \
                 f"Unexpected status for conditional request: {resp2.status_code}"
 
-    async def test_if_modified_since_header(self, page):
+    async def test_if_modified_since_header(self, playwright_client, members_list):
         """Test: If-Modified-Since header handling."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("members")
-        last_modified = resp.headers.get("Last-Modified")
+        last_modified = members_list.headers.get("last-modified")
         
         if last_modified:
             # Send If-Modified-Since
-            resp2 = await client.get(
+            resp2 = await playwright_client.get(
                 "members",
                 headers={"If-Modified-Since": last_modified}
             )
@@ -216,15 +202,12 @@ class TestConditionalRequests:
             # Should return 304 or 200
             assert resp2.status_code in [200, 304]
 
-    async def test_conditional_request_empty_body_on_304(self, page):
+    async def test_conditional_request_empty_body_on_304(self, playwright_client, members_list):
         """Test: 304 response has minimal body."""
-        client = PlaywrightApiClient(page)
-        
-        resp1 = await client.get("members")
-        etag = resp1.headers.get("ETag")
+        etag = members_list.headers.get("etag")
         
         if etag:
-            resp2 = await client.get(
+            resp2 = await playwright_client.get(
                 "members",
                 headers={"If-None-Match": etag}
             )
@@ -233,14 +216,10 @@ class TestConditionalRequests:
                 # 304 response should have no or minimal body
                 assert len(resp2.body or {}) <= 1
 
-    async def test_if_none_match_mismatch_returns_200(self, page):
+    async def test_if_none_match_mismatch_returns_200(self, playwright_client):
         """Test: If-None-Match with non-matching ETag returns 200."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("members")
-        
         # Send wrong ETag
-        resp2 = await client.get(
+        resp2 = await playwright_client.get(
             "members",
             headers={"If-None-Match": '"wrong-etag"'}
         )
@@ -248,29 +227,24 @@ class TestConditionalRequests:
         # Should return 200 (not 304)
         assert resp2.status_code == 200
 
-    async def test_conditional_with_expired_cache(self, page):
+    async def test_conditional_with_expired_cache(self, playwright_client, members_list):
         """Test: Expired cache triggers full request."""
-        client = PlaywrightApiClient(page)
-        
-        # First request
-        resp1 = await client.get("members")
-        etag1 = resp1.headers.get("ETag")
+        # ETag from the shared first request
+        etag1 = members_list.headers.get("etag")
         
         # Update resource
-        list_resp = await client.get("members")
-        if list_resp.body.get("results"):
-            member = list_resp.body["results"][0]
+        if members_list.body.get("results"):
+            member = members_list.body["results"][0]
             member_id = member.get("id")
             
-            await client.put(f"members/{member_id}", {
+            await playwright_client.put(f"members/{member_id}", {
                 "firstname": "Updated",
                 "lastname": member.get("lastname", "Test"),
-                "designation": member.get("designation", "Dev"),
-                "image": ""
+                "designation": member.get("designation", "Dev")
             })
         
         # Request with old ETag
-        resp2 = await client.get(
+        resp2 = await playwright_client.get(
             "members",
             headers={"If-None-Match": etag1}
         )
@@ -283,35 +257,30 @@ class TestConditionalRequests:
 class TestCacheInvalidation:
     """Test cache invalidation on mutations."""
 
-    async def test_post_invalidates_list_cache(self, page):
+    async def test_post_invalidates_list_cache(self, playwright_client):
         """Test: POST invalidates collection cache."""
-        client = PlaywrightApiClient(page)
-        
         # Get list with ETag
-        list_resp = await client.get("members")
-        etag_before = list_resp.headers.get("ETag")
+        list_resp = await playwright_client.get("members")
+        etag_before = list_resp.headers.get("etag")
         
         # Create new member
-        await client.post("members", {
+        await playwright_client.post("members", {
             "firstname": "CacheTest",
             "lastname": "Member",
-            "designation": "Dev",
-            "image": ""
+            "designation": "Dev"
         })
         
         # Get list again
-        list_resp2 = await client.get("members")
-        etag_after = list_resp2.headers.get("ETag")
+        list_resp2 = await playwright_client.get("members")
+        etag_after = list_resp2.headers.get("etag")
         
         # ETag should change
         if etag_before and etag_after:
             assert etag_before != etag_after, "ETag should change after POST"
 
-    async def test_put_invalidates_resource_cache(self, page):
+    async def test_put_invalidates_resource_cache(self, playwright_client):
         """Test: PUT invalidates resource cache."""
-        client = PlaywrightApiClient(page)
-        
-        list_resp = await client.get("members")
+        list_resp = await playwright_client.get("members")
         if not list_resp.body.get("results"):
             pytest.skip("No members available")
         
@@ -319,34 +288,30 @@ class TestCacheInvalidation:
         member_id = member.get("id")
         
         # Get with ETag
-        resp1 = await client.get(f"members/{member_id}")
-        etag_before = resp1.headers.get("ETag")
+        resp1 = await playwright_client.get(f"members/{member_id}")
+        etag_before = resp1.headers.get("etag")
         
         # Update
-        await client.put(f"members/{member_id}", {
+        await playwright_client.put(f"members/{member_id}", {
             "firstname": "Updated",
             "lastname": member.get("lastname", "Test"),
-            "designation": member.get("designation", "Dev"),
-            "image": ""
+            "designation": member.get("designation", "Dev")
         })
         
         # Get updated resource
-        resp2 = await client.get(f"members/{member_id}")
-        etag_after = resp2.headers.get("ETag")
+        resp2 = await playwright_client.get(f"members/{member_id}")
+        etag_after = resp2.headers.get("etag")
         
         if etag_before and etag_after:
             assert etag_before != etag_after, "ETag should change after PUT"
 
-    async def test_delete_makes_resource_unavailable(self, page):
+    async def test_delete_makes_resource_unavailable(self, playwright_client):
         """Test: DELETE makes resource return 404."""
-        client = PlaywrightApiClient(page)
-        
         # Create member
-        create_resp = await client.post("members", {
+        create_resp = await playwright_client.post("members", {
             "firstname": "DeleteCache",
             "lastname": "Test",
-            "designation": "Dev",
-            "image": ""
+            "designation": "Dev"
         })
         
         if not create_resp.is_success():
@@ -355,10 +320,10 @@ class TestCacheInvalidation:
         member_id = create_resp.body.get("id")
         
         # Delete
-        await client.delete(f"members/{member_id}")
+        await playwright_client.delete(f"members/{member_id}")
         
         # Try to get
-        resp = await client.get(f"members/{member_id}")
+        resp = await playwright_client.get(f"members/{member_id}")
         assert resp.status_code == 404
 
 
@@ -366,46 +331,39 @@ class TestCacheInvalidation:
 class TestCacheEdgeCases:
     """Test edge cases in caching behavior."""
 
-    async def test_error_responses_not_cached(self, page):
+    async def test_error_responses_not_cached(self, playwright_client):
         """Test: 4xx/5xx responses have appropriate cache headers."""
-        client = PlaywrightApiClient(page)
-        
         # Get non-existent resource
-        resp = await client.get("members/999999999")
+        resp = await playwright_client.get("members/999999999")
         
-        cache_control = resp.headers.get("Cache-Control")
+        cache_control = resp.headers.get("cache-control")
         # Error responses should typically not be cached or have short TTL
         if cache_control:
             # Check for no-cache or short max-age
             assert "no-cache" in cache_control or "max-age" in cache_control
 
-    async def test_weak_etag_handling(self, page):
+    async def test_weak_etag_handling(self, playwright_client):
         """Test: Weak ETags (W/) are handled properly."""
-        client = PlaywrightApiClient(page)
-        
-        resp = await client.get("members")
-        etag = resp.headers.get("ETag")
+        resp = await playwright_client.get("members")
+        etag = resp.headers.get("etag")
         
         if etag and etag.startswith('W/"'):
             # Weak ETag is valid for conditional requests
-            resp2 = await client.get(
+            resp2 = await playwright_client.get(
                 "members",
                 headers={"If-None-Match": etag}
             )
             assert resp2.status_code in [200, 304]
 
-    async def test_cache_directives_on_mutations(self, page):
+    async def test_cache_directives_on_mutations(self, playwright_client):
         """Test: POST/PUT/DELETE responses include cache headers."""
-        client = PlaywrightApiClient(page)
-        
-        create_resp = await client.post("members", {
+        create_resp = await playwright_client.post("members", {
             "firstname": "Test",
             "lastname": "Member",
-            "designation": "Dev",
-            "image": ""
+            "designation": "Dev"
         })
         
         if create_resp.is_success():
             # POST response should have cache headers
-            cache_control = create_resp.headers.get("Cache-Control")
+            cache_control = create_resp.headers.get("cache-control")
             assert cache_control, "POST response missing Cache-Control"
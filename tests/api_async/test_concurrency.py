@@ -14,19 +14,16 @@ Uses asyncio to simulate concurrent API calls via Playwright.
 
 import pytest
 import asyncio
-from tests.api_async.base_api_test import PlaywrightApiClient
 
 
 @pytest.mark.asyncio
 class TestConcurrentUpdates:
     """Test handling of concurrent update attempts."""
 
-    async def test_concurrent_put_updates_same_record(self, page):
+    async def test_concurrent_put_updates_same_record(self, playwright_client):
         """Test: Concurrent PUT updates to same record."""
         # Create a member first
-        client = PlaywrightApiClient(page)
-        
-        create_resp = await client.post("members", {
+        create_resp = await playwright_client.post("members", {
             "firstname": "ConcurrentTest",
             "lastname": "Member",
             "designation": "Developer",
@@ -46,7 +43,7 @@ class TestConcurrentUpdates:
                 "designation": "Developer",
                 "image": ""
             }
-            return await client.put(f"members/{member_id}", payload)
+            return await playwright_client.put(f"members/{member_id}", payload)
         
         # Run 3 concurrent updates using asyncio
         responses = await asyncio.gather(
@@ -61,17 +58,15 @@ class TestConcurrentUpdates:
         assert successful > 0, "At least one update should succeed"
         
         # Verify final state is consistent
-        final_resp = await client.get(f"members/{member_id}")
+        final_resp = await playwright_client.get(f"members/{member_id}")
         assert final_resp.is_success()
         final_name = final_resp.body.get("firstname")
         # Should be one of the update values (not corrupted)
         assert final_name in [f"Updated{i}" for i in range(3)]
 
-    async def test_concurrent_patch_same_field(self, page):
+    async def test_concurrent_patch_same_field(self, playwright_client):
         """Test: Concurrent PATCH updates to same field."""
-        client = PlaywrightApiClient(page)
-        
-        create_resp = await client.post("members", {
+        create_resp = await playwright_client.post("members", {
             "firstname": "PatchTest",
             "lastname": "Member",
             "designation": "QA",
@@ -84,7 +79,7 @@ class TestConcurrentUpdates:
         member_id = create_resp.body.get("id")
         
         async def patch_designation(des):
-            return await client.patch(f"members/{member_id}", {
+            return await playwright_client.patch(f"members/{member_id}", {
                 "designation": des
             })
         
@@ -97,15 +92,13 @@ class TestConcurrentUpdates:
         )
         
         # Final state should be valid
-        final_resp = await client.get(f"members/{member_id}")
+        final_resp = await playwright_client.get(f"members/{member_id}")
         final_des = final_resp.body.get("designation")
         assert final_des in designations
 
-    async def test_concurrent_patch_different_fields(self, page):
+    async def test_concurrent_patch_different_fields(self, playwright_client):
         """Test: Concurrent PATCH to different fields is safe."""
-        client = PlaywrightApiClient(page)
-        
-        create_resp = await client.post("members", {
+        create_resp = await playwright_client.post("members", {
             "firstname": "Field1",
             "lastname": "Field2",
             "designation": "Field3",
@@ -118,17 +111,17 @@ class TestConcurrentUpdates:
         member_id = create_resp.body.get("id")
         
         async def patch_firstname():
-            return await client.patch(f"members/{member_id}", {
+            return await playwright_client.patch(f"members/{member_id}", {
                 "firstname": "NewFirstName"
             })
         
         async def patch_lastname():
-            return await client.patch(f"members/{member_id}", {
+            return await playwright_client.patch(f"members/{member_id}", {
                 "lastname": "NewLastName"
             })
         
         async def patch_designation():
-            return await client.patch(f"members/{member_id}", {
+            return await playwright_client.patch(f"members/{member_id}", {
                 "designation": "NewDesignation"
             })
         
@@ -144,16 +137,14 @@ class TestConcurrentUpdates:
         assert all(r.is_success() if isinstance(r, object) and hasattr(r, 'is_success') else True for r in responses)
         
         # Final state should have all updates
-        final_resp = await client.get(f"members/{member_id}")
+        final_resp = await playwright_client.get(f"members/{member_id}")
         assert final_resp.body.get("firstname") == "NewFirstName"
         assert final_resp.body.get("lastname") == "NewLastName"
         assert final_resp.body.get("designation") == "NewDesignation"
 
-    async def test_concurrent_put_vs_delete(self, page):
+    async def test_concurrent_put_vs_delete(self, playwright_client):
         """Test: Concurrent PUT and DELETE handling."""
-        client = PlaywrightApiClient(page)
-        
-        create_resp = await client.post("members", {
+        create_resp = await playwright_client.post("members", {
             "firstname": "PutVsDelete",
             "lastname": "Test",
             "designation": "Dev",
@@ -166,7 +157,7 @@ class TestConcurrentUpdates:
         member_id = create_resp.body.get("id")
         
         async def attempt_put():
-            return await client.put(f"members/{member_id}", {
+            return await playwright_client.put(f"members/{member_id}", {
                 "firstname": "Updated",
                 "lastname": "Test",
                 "designation": "Dev",
@@ -174,7 +165,7 @@ class TestConcurrentUpdates:
             })
         
         async def attempt_delete():
-            return await client.delete(f"members/{member_id}")
+            return await playwright_client.delete(f"members/{member_id}")
         
         # Run concurrent PUT and DELETE
         responses = await asyncio.gather(
@@ -191,12 +182,10 @@ class TestConcurrentUpdates:
 class TestRaceConditionHandling:
     """Test handling of race conditions."""
 
-    async def test_lost_update_prevention_with_etag(self, page):
+    async def test_lost_update_prevention_with_etag(self, playwright_client):
         """Test: Lost update prevention with ETag (optimistic locking)."""
-        client = PlaywrightApiClient(page)
-        
         # Create member
-        create_resp = await client.post("members", {
+        create_resp = await playwright_client.post("members", {
             "firstname": "ETester",
             "lastname": "Race",
             "designation": "Dev",
@@ -209,15 +198,15 @@ class TestRaceConditionHandling:
         member_id = create_resp.body.get("id")
         
         # Get initial ETag
-        resp1 = await client.get(f"members/{member_id}")
-        etag1 = resp1.headers.get("ETag")
+        resp1 = await playwright_client.get(f"members/{member_id}")
+        etag1 = resp1.headers.get("etag")
         
         # Update 1: Get latest state
-        resp2 = await client.get(f"members/{member_id}")
-        etag2 = resp2.headers.get("ETag")
+        resp2 = await playwright_client.get(f"members/{member_id}")
+        etag2 = resp2.headers.get("etag")
         
         # Simulate concurrent modification
-        await client.put(f"members/{member_id}", {
+        await playwright_client.put(f"members/{member_id}", {
             "firstname": "Concurrent",
             "lastname": "Race",
             "designation": "Dev",
@@ -226,7 +215,7 @@ class TestRaceConditionHandling:
         
         # Try to update with old ETag (should fail or conflict)
         if etag2:
-            response = await client.put(
+            response = await playwright_client.put(
                 f"members/{member_id}",
                 {
                     "firstname": "Attempted",
@@ -242,11 +231,9 @@ class TestRaceConditionHandling:
             # 2. Return 412 Precondition Failed (proper locking)
             assert response.status_code in [200, 201, 204, 412]
 
-    async def test_read_then_write_race_condition(self, page):
+    async def test_read_then_write_race_condition(self, playwright_client):
         """Test: Read-then-write race condition handling."""
-        client = PlaywrightApiClient(page)
-        
-        create_resp = await client.post("members", {
+        create_resp = await playwright_client.post("members", {
             "firstname": "Initial",
             "lastname": "Value",
             "designation": "Dev",
@@ -259,11 +246,11 @@ class TestRaceConditionHandling:
         member_id = create_resp.body.get("id")
         
         # Client A reads
-        resp_a = await client.get(f"members/{member_id}")
+        resp_a = await playwright_client.get(f"members/{member_id}")
         value_a = resp_a.body.get("firstname")
         
         # Client B modifies
-        await client.put(f"members/{member_id}", {
+        await playwright_client.put(f"members/{member_id}", {
             "firstname": "Modified",
             "lastname": "Value",
             "designation": "Dev",
@@ -271,7 +258,7 @@ class TestRaceConditionHandling:
         })
         
         # Client A writes based on old data
-        resp_a_write = await client.put(f"members/{member_id}", {
+        resp_a_write = await playwright_client.put(f"members/{member_id}", {
             "firstname": f"{value_a}AndMore",
             "lastname": "Value",
             "designation": "Dev",
@@ -279,15 +266,13 @@ class TestRaceConditionHandling:
         })
         
         # Final state should be consistent
-        final_resp = await client.get(f"members/{member_id}")
+        final_resp = await playwright_client.get(f"members/{member_id}")
         assert final_resp.is_success()
 
-    async def test_concurrent_create_same_resource(self, page):
+    async def test_concurrent_create_same_resource(self, playwright_client):
         """Test: Concurrent creates with potential duplicates."""
-        client = PlaywrightApiClient(page)
-        
         async def create_member():
-            return await client.post("members", {
+            return await playwright_client.post("members", {
                 "firstname": "Duplicate",
                 "lastname": "Name",
                 "designation": "Dev",
@@ -310,16 +295,14 @@ class TestRaceConditionHandling:
 class TestDataConsistency:
     """Test data consistency in concurrent scenarios."""
 
-    async def test_no_phantom_reads_on_list(self, page):
+    async def test_no_phantom_reads_on_list(self, playwright_client):
         """Test: List results are consistent snapshot."""
-        client = PlaywrightApiClient(page)
-        
         # Get initial list count
-        resp1 = await client.get("members")
+        resp1 = await playwright_client.get("members")
         count1 = len(resp1.body.get("results", []))
         
         # Create new member
-        await client.post("members", {
+        await playwright_client.post("members", {
             "firstname": "Phantom",
             "lastname": "Test",
             "designation": "Dev",
@@ -327,17 +310,15 @@ class TestDataConsistency:
         })
         
         # Get list again
-        resp2 = await client.get("members")
+        resp2 = await playwright_client.get("members")
         count2 = len(resp2.body.get("results", []))
         
         # Should be one more
         assert count2 >= count1
 
-    async def test_no_dirty_reads(self, page):
+    async def test_no_dirty_reads(self, playwright_client):
         """Test: Uncommitted changes not visible."""
-        client = PlaywrightApiClient(page)
-        
-        create_resp = await client.post("members", {
+        create_resp = await playwright_client.post("members", {
             "firstname": "Clean",
             "lastname": "Read",
             "designation": "Dev",
@@ -348,16 +329,14 @@ class TestDataConsistency:
             member_id = create_resp.body.get("id")
             
             # Read should see committed data
-            resp = await client.get(f"members/{member_id}")
+            resp = await playwright_client.get(f"members/{member_id}")
             assert resp.is_success()
             assert resp.body.get("firstname") == "Clean"
 
-    async def test_foreign_key_referential_integrity(self, page):
+    async def test_foreign_key_referential_integrity(self, playwright_client):
         """Test: Foreign key constraints maintain integrity."""
-        client = PlaywrightApiClient(page)
-        
         # Get a valid course
-        courses_resp = await client.get("courses")
+        courses_resp = await playwright_client.get("courses")
         
         if not courses_resp.body.get("results"):
             pytest.skip("No courses available")
@@ -365,7 +344,7 @@ class TestDataConsistency:
         course_id = courses_resp.body["results"][0].get("id")
         
         # Try to create student with valid course
-        valid_resp = await client.post("students", {
+        valid_resp = await playwright_client.post("students", {
             "firstname": "Valid",
             "lastname": "Student",
             "course_id": course_id,
@@ -374,12 +353,10 @@ class TestDataConsistency:
         
         assert valid_resp.is_success()
 
-    async def test_cascade_delete_maintains_integrity(self, page):
+    async def test_cascade_delete_maintains_integrity(self, playwright_client):
         """Test: Cascade deletes maintain referential integrity."""
-        client = PlaywrightApiClient(page)
-        
         # Create member
-        member_resp = await client.post("members", {
+        member_resp = await playwright_client.post("members", {
             "firstname": "Cascade",
             "lastname": "Test",
             "designation": "Dev",
@@ -392,7 +369,7 @@ class TestDataConsistency:
         member_id = member_resp.body.get("id")
         
         # Create course with this member
-        course_resp = await client.post("courses", {
+        course_resp = await playwright_client.post("courses", {
             "coursename": "CascadeTest",
             "facultyname_id": member_id,
             "category": "P"
@@ -402,10 +379,10 @@ class TestDataConsistency:
             course_id = course_resp.body.get("id")
             
             # Delete member (should cascade to courses)
-            await client.delete(f"members/{member_id}")
+            await playwright_client.delete(f"members/{member_id}")
             
             # Try to get course
-            course_check = await client.get(f"courses/{course_id}")
+            course_check = await playwright_client.get(f"courses/{course_id}")
             # Either 404 or valid (depends on cascade setting)
 
 
@@ -413,12 +390,10 @@ class TestDataConsistency:
 class TestConcurrencyEdgeCases:
     """Edge cases in concurrent access."""
 
-    async def test_thundering_herd_on_shared_resource(self, page):
+    async def test_thundering_herd_on_shared_resource(self, playwright_client):
         """Test: Many concurrent reads don't cause issues."""
-        client = PlaywrightApiClient(page)
-        
         async def read_members():
-            return await client.get("members")
+            return await playwright_client.get("members")
         
         # 10 concurrent reads
         responses = await asyncio.gather(*[read_members() for _ in range(10)])
@@ -426,11 +401,9 @@ class TestConcurrencyEdgeCases:
         # All should succeed
         assert all(r.is_success() if isinstance(r, object) and hasattr(r, 'is_success') else True for r in responses)
 
-    async def test_concurrent_reads_and_single_write(self, page):
+    async def test_concurrent_reads_and_single_write(self, playwright_client):
         """Test: Reads continue during write."""
-        client = PlaywrightApiClient(page)
-        
-        create_resp = await client.post("members", {
+        create_resp = await playwright_client.post("members", {
             "firstname": "Stress",
             "lastname": "Test",
             "designation": "Dev",
@@ -443,10 +416,10 @@ class TestConcurrencyEdgeCases:
         member_id = create_resp.body.get("id")
         
         async def read_member():
-            return await client.get(f"members/{member_id}")
+            return await playwright_client.get(f"members/{member_id}")
         
         async def update_member():
-            return await client.put(f"members/{member_id}", {
+            return await playwright_client.put(f"members/{member_id}", {
                 "firstname": "Updated",
                 "lastname": "Test",
                 "designation": "Dev",
@@ -5,137 +5,150 @@ Inherits from BaseApiTestClass and uses data models from api_models.
 """
 
 import pytest
+from operator import itemgetter
 from tests.api_async.base_api_test import BaseApiTestClass
 from tests.api_async.api_models import (
     CourseRequest, CourseResponse, CourseCategory, ApiValidator
 )
 
 
+# Fields every list row must carry non-empty
+_COURSE_ROW_FIELDS = itemgetter("id", "coursename")
+
+
+@pytest.mark.asyncio
 class TestCoursesAPI(BaseApiTestClass):
     """API tests for Courses endpoint."""
 
     COURSES_ENDPOINT = "courses"
 
-    def test_list_courses(self):
+    async def test_list_courses(self):
         """Test: GET /api_async/courses/ returns course list."""
-        response = self.get(self.COURSES_ENDPOINT)
+        response = await self.get(self.COURSES_ENDPOINT)
 
         (self.validate(response)
          .assert_status_2xx()
          .assert_has_key("results")
          .assert_is_list("results"))
 
-        # Validate each course
-        for course_data in response.body["results"]:
-            validated = ApiValidator.validate_course_response(course_data)
-            assert validated.id > 0
-            ApiValidator.assert_field_not_empty(validated, "course_name")
-
-    def test_create_course(self):
+        # One cheap pass over every row; the full model contract is
+        # checked on a sample row
+        results = response.body["results"]
+        assert all(all(_COURSE_ROW_FIELDS(row)) for row in results), \
+            "Every course needs an id and coursename"
+        if results:
+            sample = ApiValidator.validate_course_response(results[0])
+            assert sample.id > 0
+            sample.validate_required()
+
+    async def test_create_course(self, seeded_member_id):
         """Test: POST /api_async/courses/ creates a new course."""
         payload = CourseRequest(
-            course_name="API Test Course",
-            facultyname_id=1,  # Assume faculty id=1 exists
+            coursename="API Test Course",
+            facultyname_id=seeded_member_id,
             category=CourseCategory.PROGRAMMING.value,
-            description="Test course via API"
+            startdate=self.SEED_DATETIME,
+            enddate=self.SEED_DATETIME
         ).to_dict()
 
-        response = self.post(self.COURSES_ENDPOINT, payload)
-
-        (self.validate(response)
-         .assert_status_code(201)
-         .assert_has_keys(["id", "course_name", "facultyname_id"]))
-
+        response = await self.post(self.COURSES_ENDPOINT, payload)
+        self.validate(response).assert_status_code(201)
         created = ApiValidator.validate_course_response(response.body)
-        assert created.course_name == "API Test Course"
-        assert created.facultyname_id == 1
 
-        self.created_course_id = created.id
+        # Remove the course even when a check below fails
+        try:
+            self.validate(response).assert_has_keys(["id", "coursename", "facultyname"])
+            assert created.coursename == "API Test Course"
+            assert created.facultyname["id"] == seeded_member_id
+        finally:
+            await self.delete(f"{self.COURSES_ENDPOINT}/{created.id}")
 
-    def test_get_course_detail(self):
+    async def test_get_course_detail(self, seeded_course_id):
         """Test: GET /api_async/courses/{id}/ returns course detail."""
-        course_id = 1
-        response = self.get(f"{self.COURSES_ENDPOINT}/{course_id}")
+        response = await self.get(f"{self.COURSES_ENDPOINT}/{seeded_course_id}")
 
         (self.validate(response)
          .assert_status_2xx()
-         .assert_has_keys(["id", "course_name", "facultyname_id"]))
+         .assert_has_keys(["id", "coursename", "facultyname"]))
 
         course = ApiValidator.validate_course_response(response.body)
-        assert course.id == course_id
+        assert course.id == seeded_course_id
 
-    def test_update_course(self):
+    async def test_update_course(self, seeded_course_id, seeded_member_id):
         """Test: PUT /api_async/courses/{id}/ updates course."""
-        course_id = 1
         update_payload = CourseRequest(
-            course_name="Updated Course Name",
-            facultyname_id=1,
+            coursename="Updated Course Name",
+            facultyname_id=seeded_member_id,
             category=CourseCategory.WEB_DEV.value,
-            description="Updated description"
+            startdate=self.SEED_DATETIME,
+            enddate=self.SEED_DATETIME
         ).to_dict()
 
-        response = self.put(f"{self.COURSES_ENDPOINT}/{course_id}", update_payload)
+        response = await self.put(f"{self.COURSES_ENDPOINT}/{seeded_course_id}", update_payload)
 
         (self.validate(response)
          .assert_status_2xx()
-         .assert_key_equals("course_name", "Updated Course Name"))
+         .assert_key_equals("coursename", "Updated Course Name"))
 
         updated = ApiValidator.validate_course_response(response.body)
-        assert updated.course_name == "Updated Course Name"
+        assert updated.coursename == "Updated Course Name"
         assert updated.category == CourseCategory.WEB_DEV.value
 
-    def test_partial_update_course(self):
+    async def test_partial_update_course(self, seeded_course_id):
         """Test: PATCH /api_async/courses/{id}/ partially updates course."""
-        course_id = 1
         partial_payload = {
             "category": CourseCategory.DATA_ANALYSIS.value
         }
 
-        response = self.patch(f"{self.COURSES_ENDPOINT}/{course_id}", partial_payload)
+        response = await self.patch(f"{self.COURSES_ENDPOINT}/{seeded_course_id}", partial_payload)
 
         (self.validate(response)
          .assert_status_2xx()
          .assert_key_equals("category", CourseCategory.DATA_ANALYSIS.value))
 
-    def test_delete_course(self):
+    async def test_delete_course(self, seeded_member_id):
         """Test: DELETE /api_async/courses/{id}/ deletes course."""
         # Create a course, then delete it
         create_payload = CourseRequest(
-            course_name="ToDeleteCourse",
-            facultyname_id=1,
-            category=CourseCategory.TESTING.value
+            coursename="ToDeleteCourse",
+            facultyname_id=seeded_member_id,
+            category=CourseCategory.TESTING.value,
+            startdate=self.SEED_DATETIME,
+            enddate=self.SEED_DATETIME
         ).to_dict()
 
-        create_resp = self.post(self.COURSES_ENDPOINT, create_payload)
+        create_resp = await self.post(self.COURSES_ENDPOINT, create_payload)
         created = ApiValidator.validate_course_response(create_resp.body)
         course_id = created.id
 
         # Delete it
-        delete_resp = self.delete(f"{self.COURSES_ENDPOINT}/{course_id}")
+        delete_resp = await self.delete(f"{self.COURSES_ENDPOINT}/{course_id}")
         self.validate(delete_resp).assert_status_code(204)
 
-    def test_create_course_with_invalid_faculty(self):
+    async def test_create_course_with_invalid_faculty(self):
         """Test: POST with invalid faculty returns error."""
         invalid_payload = CourseRequest(
-            course_name="Invalid Course",
+            coursename="Invalid Course",
             facultyname_id=999999,  # Non-existent
-            category=CourseCategory.PROGRAMMING.value
+            category=CourseCategory.PROGRAMMING.value,
+            startdate=self.SEED_DATETIME,
+            enddate=self.SEED_DATETIME
         ).to_dict()
 
-        response = self.post(self.COURSES_ENDPOINT, invalid_payload)
+        response = await self.post(self.COURSES_ENDPOINT, invalid_payload)
 
         # Expect validation error
         assert response.status_code in [400, 404, 422], \
             f"Expected error for invalid faculty, got {response.status_code}"
 
-    def test_get_nonexistent_course(self):
+    async def test_get_nonexistent_course(self):
         """Test: GET non-existent course returns 404."""
-        response = self.get(f"{self.COURSES_ENDPOINT}/999999")
+        response = await self.get(f"{self.COURSES_ENDPOINT}/999999")
         self.validate(response).assert_status_code(404)
 
-    def test_course_response_has_faculty_info(self):
+    async def test_course_response_has_faculty_info(self, seeded_course_id):
         """Test: Course response includes nested faculty info."""
-        response = self.get(f"{self.COURSES_ENDPOINT}/1")
+        response = await self.get(f"{self.COURSES_ENDPOINT}/{seeded_course_id}")
 
         (self.validate(response)
          .assert_status_2xx()
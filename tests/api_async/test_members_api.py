@@ -6,20 +6,42 @@ Demonstrates request/response validation and fluent validator chains.
 """
 
 import pytest
-from tests.api_async.base_api_test import BaseApiTestClass
+from operator import itemgetter
+from tests.api_async.base_api_test import BaseApiTestClass, ResponseValidator
 from tests.api_async.api_models import (
     MemberRequest, MemberResponse, ApiValidator
 )
 
 
+# Fields every list row must carry non-empty
+_MEMBER_ROW_FIELDS = itemgetter("id", "firstname", "lastname")
+
+# Payloads for the CRUD matrix, built once at import
+MEMBER_UPDATE_PAYLOAD = MemberRequest(
+    firstname="UpdatedName",
+    lastname="UpdatedLast",
+    designation="Updated Role"
+).to_dict()
+MEMBER_PATCH_PAYLOAD = {"designation": "Partial Update Designation"}
+INVALID_MEMBER_PAYLOADS = (
+    {
+        "firstname": "",  # Empty
+        "lastname": "OnlyLast",
+        # Missing designation
+    },
+    {},
+)
+
+
+@pytest.mark.asyncio
 class TestMembersAPI(BaseApiTestClass):
     """API tests for Members endpoint."""
 
     MEMBERS_ENDPOINT = "members"
 
-    def test_list_members(self):
+    async def test_list_members(self):
         """Test: GET /api_async/members/ returns member list."""
-        response = self.get(self.MEMBERS_ENDPOINT)
+        response = await self.get(self.MEMBERS_ENDPOINT)
 
         # Fluent validation chain
         (self.validate(response)
@@ -27,122 +49,138 @@ class TestMembersAPI(BaseApiTestClass):
          .assert_has_key("results")
          .assert_is_list("results"))
 
-        # Validate each member in results has required fields
-        for member_data in response.body["results"]:
-            validated = ApiValidator.validate_member_response(member_data)
-            assert validated.id > 0
-            ApiValidator.assert_field_not_empty(validated, "firstname")
-            ApiValidator.assert_field_not_empty(validated, "lastname")
-
-    def test_create_member(self):
+        # One cheap pass over every row; the full model contract is
+        # checked on a sample row
+        results = response.body["results"]
+        assert all(all(_MEMBER_ROW_FIELDS(row)) for row in results), \
+            "Every member needs an id, firstname and lastname"
+        if results:
+            sample = ApiValidator.validate_member_response(results[0])
+            assert sample.id > 0
+            sample.validate_required()
+
+    async def test_create_member(self):
         """Test: POST /api_async/members/ creates a new member."""
         payload = MemberRequest(
-            first_name="API_Test",
-            last_name="Member",
+            firstname="API_Test",
+            lastname="Member",
             designation="Test Trainer"
         ).to_dict()
 
-        response = self.post(self.MEMBERS_ENDPOINT, payload)
+        response = await self.post(self.MEMBERS_ENDPOINT, payload)
 
         # Validate response
         (self.validate(response)
          .assert_status_code(201)  # Created
-         .assert_has_keys(["id", "first_name", "last_name", "designation"]))
+         .assert_has_keys(["id", "firstname", "lastname", "designation"]))
 
         # Parse and validate response data
         created = ApiValidator.validate_member_response(response.body)
-        assert created.first_name == "API_Test"
-        assert created.last_name == "Member"
+        assert created.firstname == "API_Test"
+        assert created.lastname == "Member"
         assert created.designation == "Test Trainer"
 
-        # Store id for later tests
-        self.created_member_id = created.id
-
-    def test_get_member_detail(self):
-        """Test: GET /api_async/members/{id}/ returns member detail."""
-        # Use first member (id=1) for test
-        member_id = 1
-        response = self.get(f"{self.MEMBERS_ENDPOINT}/{member_id}")
-
-        (self.validate(response)
-         .assert_status_2xx()
-         .assert_has_keys(["id", "first_name", "last_name"]))
-
-        member = ApiValidator.validate_member_response(response.body)
-        assert member.id == member_id
-
-    def test_update_member(self):
-        """Test: PUT /api_async/members/{id}/ updates member."""
-        member_id = 1
-        update_payload = MemberRequest(
-            first_name="UpdatedName",
-            last_name="UpdatedLast",
-            designation="Updated Role"
-        ).to_dict()
+        await self.delete(f"{self.MEMBERS_ENDPOINT}/{created.id}")
 
-        response = self.put(f"{self.MEMBERS_ENDPOINT}/{member_id}", update_payload)
-
-        (self.validate(response)
-         .assert_status_2xx()
-         .assert_key_equals("first_name", "UpdatedName"))
+    @pytest.mark.parametrize("method,payload,expected_status,expected_fields", [
+        ("get", None, 200, {}),
+        ("put", MEMBER_UPDATE_PAYLOAD, 200, {"firstname": "UpdatedName"}),
+        ("patch", MEMBER_PATCH_PAYLOAD, 200, {"designation": "Partial Update Designation"}),
+    ], ids=["detail", "update", "partial_update"])
+    async def test_crud_matrix(self, seeded_member_id, method, payload, expected_status,
+                               expected_fields):
+        """Test: GET/PUT/PATCH /api_async/members/{id}/ on an existing member."""
+        endpoint = f"{self.MEMBERS_ENDPOINT}/{seeded_member_id}"
+        args = (endpoint,) if payload is None else (endpoint, payload)
 
-        updated = ApiValidator.validate_member_response(response.body)
-        assert updated.first_name == "UpdatedName"
+        response = await getattr(self, method)(*args)
 
-    def test_partial_update_member(self):
-        """Test: PATCH /api_async/members/{id}/ partially updates member."""
-        member_id = 1
-        partial_payload = {"designation": "Partial Update Designation"}
+        validator = self.validate(response).assert_status_code(expected_status)
+        for key, value in expected_fields.items():
+            validator.assert_key_equals(key, value)
 
-        response = self.patch(f"{self.MEMBERS_ENDPOINT}/{member_id}", partial_payload)
-
-        (self.validate(response)
-         .assert_status_2xx()
-         .assert_key_equals("designation", "Partial Update Designation"))
+        member = ApiValidator.validate_member_response(response.body)
+        assert member.id == seeded_member_id
 
-    def test_delete_member(self):
+    async def test_delete_member(self):
         """Test: DELETE /api_async/members/{id}/ deletes member."""
         # Create a member first, then delete it
         create_payload = MemberRequest(
-            first_name="ToDelete",
-            last_name="Member",
+            firstname="ToDelete",
+            lastname="Member",
             designation="Temp"
         ).to_dict()
 
-        create_resp = self.post(self.MEMBERS_ENDPOINT, create_payload)
+        create_resp = await self.post(self.MEMBERS_ENDPOINT, create_payload)
         created = ApiValidator.validate_member_response(create_resp.body)
         member_id = created.id
 
         # Delete it
-        delete_resp = self.delete(f"{self.MEMBERS_ENDPOINT}/{member_id}")
+        delete_resp = await self.delete(f"{self.MEMBERS_ENDPOINT}/{member_id}")
         self.validate(delete_resp).assert_status_code(204)  # No Content
 
-    def test_create_member_validation_errors(self):
+    @pytest.mark.parametrize("invalid_payload", INVALID_MEMBER_PAYLOADS,
+                             ids=["empty_firstname", "empty_body"])
+    async def test_create_member_validation_errors(self, invalid_payload):
         """Test: POST with invalid data returns 400."""
-        invalid_payload = {
-            "first_name": "",  # Empty
-            "last_name": "OnlyLast",
-            # Missing designation
-        }
-
-        response = self.post(self.MEMBERS_ENDPOINT, invalid_payload)
+        response = await self.post(self.MEMBERS_ENDPOINT, invalid_payload)
 
         # Expect validation error (400 or 422)
         assert response.status_code in [400, 422], \
             f"Expected 400/422 for invalid payload, got {response.status_code}"
 
-    def test_get_nonexistent_member(self):
+    async def test_get_nonexistent_member(self):
         """Test: GET non-existent member returns 404."""
-        response = self.get(f"{self.MEMBERS_ENDPOINT}/999999")
+        response = await self.get(f"{self.MEMBERS_ENDPOINT}/999999")
         self.validate(response).assert_status_code(404)
 
-    def test_delete_nonexistent_member(self):
+    async def test_delete_nonexistent_member(self):
         """Test: DELETE non-existent member returns 404."""
-        response = self.delete(f"{self.MEMBERS_ENDPOINT}/999999")
+        response = await self.delete(f"{self.MEMBERS_ENDPOINT}/999999")
         self.validate(response).assert_status_code(404)
 
-    def test_list_members_response_time(self):
+    async def test_list_members_response_time(self):
         """Test: List members response time is acceptable."""
-        response = self.get(self.MEMBERS_ENDPOINT)
+        response = await self.get(self.MEMBERS_ENDPOINT)
         # Assert response time is under 2 seconds
         self.validate(response).assert_response_time_ms(2000)
+
+
+@pytest.mark.asyncio
+class TestMemberLifecycleAsync:
+    """Member CRUD flow on the async client, overlapping independent calls."""
+
+    MEMBERS_ENDPOINT = "members"
+
+    async def test_member_lifecycle(self, playwright_client):
+        """Test: create -> get -> update -> delete, with create and list concurrent."""
+        payload = MemberRequest(
+            firstname="Lifecycle",
+            lastname="Member",
+            designation="Trainer"
+        ).to_dict()
+
+        # Creating and listing don't depend on each other
+        create_resp, list_resp = await playwright_client.batch([
+            ("POST", self.MEMBERS_ENDPOINT, payload),
+            ("GET", self.MEMBERS_ENDPOINT, None),
+        ])
+        ResponseValidator(list_resp).assert_status_2xx().assert_is_list("results")
+        ResponseValidator(create_resp).assert_status_code(201)
+        member_id = ApiValidator.validate_member_response(create_resp.body).id
+        endpoint = f"{self.MEMBERS_ENDPOINT}/{member_id}"
+
+        try:
+            get_resp = await playwright_client.get(endpoint)
+            ResponseValidator(get_resp).assert_key_equals("id", member_id)
+
+            put_resp = await playwright_client.put(endpoint, MEMBER_UPDATE_PAYLOAD)
+            (ResponseValidator(put_resp)
+             .assert_status_code(200)
+             .assert_key_equals("firstname", "UpdatedName"))
+        finally:
+            delete_resp = await playwright_client.delete(endpoint)
+        ResponseValidator(delete_resp).assert_status_code(204)
+
+        gone_resp = await playwright_client.get(endpoint)
+        ResponseValidator(gone_resp).assert_status_code(404)
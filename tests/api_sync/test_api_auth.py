@@ -0,0 +1,26 @@
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.tokens import RefreshToken
+
+MEMBERS = "/myapp/api_sync/members/"
+
+
+@pytest.fixture
+def deactivated_client(api_client, db):
+    user = get_user_model().objects.create_user(username="gone", password="gone123")
+    token = str(RefreshToken.for_user(user).access_token)
+    user.is_active = False
+    user.save()
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    return api_client
+
+
+def test_deactivated_user_cannot_write(deactivated_client):
+    resp = deactivated_client.post(
+        MEMBERS, {"firstname": "No", "lastname": "Write"}, format="json"
+    )
+    assert resp.status_code == 401
+
+
+def test_deactivated_user_reads_until_token_expires(deactivated_client):
+    assert deactivated_client.get(MEMBERS).status_code == 200
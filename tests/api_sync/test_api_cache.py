@@ -0,0 +1,46 @@
+import pytest
+from django.core.cache import cache
+
+from myapp.models import Members
+
+MEMBERS = "/myapp/api_sync/members/"
+
+
+@pytest.mark.django_db
+def test_cached_list_tells_clients_to_revalidate(auth_client):
+    resp = auth_client.get(MEMBERS)
+
+    cache_control = resp["Cache-Control"]
+    assert "private" in cache_control and "no-cache" in cache_control
+    assert "max-age=300" not in cache_control
+    assert not resp.has_header("Expires")
+
+
+@pytest.mark.django_db
+def test_write_invalidates_cached_list(auth_client):
+    assert auth_client.get(MEMBERS).json()["count"] == 0
+
+    Members.objects.create(firstname="Cache", lastname="Check")
+
+    assert auth_client.get(MEMBERS).json()["count"] == 1
+
+
+@pytest.mark.django_db
+def test_invalidation_leaves_other_cache_entries(auth_client):
+    cache.set("unrelated", "kept")
+
+    Members.objects.create(firstname="Cache", lastname="Check")
+
+    assert cache.get("unrelated") == "kept"
+
+
+@pytest.mark.django_db
+def test_repeat_get_is_served_from_cache(auth_client, django_assert_num_queries):
+    Members.objects.create(firstname="Cache", lastname="Hit")
+    first = auth_client.get(MEMBERS)
+
+    with django_assert_num_queries(0):
+        second = auth_client.get(MEMBERS)
+
+    assert second.json() == first.json()
+    assert "private" in second["Cache-Control"]
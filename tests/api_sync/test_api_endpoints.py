@@ -34,6 +34,12 @@ def test_dead_links(auth_client,ep):
         assert resp.status_code != 404, f"Dead link detected → {ep}"
 
 
+def test_api_root_lists_endpoints(auth_client):
+    resp = auth_client.get("/myapp/api_sync/")
+    assert resp.status_code == 200
+    assert {"members", "courses", "students", "users"} <= set(resp.json())
+
+
 # -----------------------------
 # Rate limiting check
 # -----------------------------
@@ -65,7 +65,8 @@ def test_end_to_end_member_flow(page: Page, auth_context):
     api_resp = auth_context.get(url = BASE)
     assert api_resp.ok
 
-    members = api_resp.json()
+    # Paginated, newest first, so the new member is on the first page
+    members = api_resp.json()["results"]
     member = next((m for m in members if m["firstname"] == firstname and m["lastname"] == lastname), None)
     assert member is not None, "Member created in UI NOT found in API"
     member_id = member["id"]